@@ -1,8 +1,11 @@
 # src/darca_vector_db/__init__.py
 
 from .db_client import (
+    AsyncDBClient,
+    AsyncQdrantDBClient,
     BaseDBClient,
     CollectionCreationError,
+    CollectionUpdateError,
     DBClient,
     DBClientException,
     DBConnectionError,
@@ -14,10 +17,13 @@ from .db_client import (
 __all__ = [
     "DBClient",
     "QdrantDBClient",
+    "AsyncDBClient",
+    "AsyncQdrantDBClient",
     "BaseDBClient",
     "DBClientException",
     "DBConnectionError",
     "CollectionCreationError",
+    "CollectionUpdateError",
     "VectorInsertionError",
     "VectorSearchError",
 ]
@@ -9,20 +9,311 @@ Modules:
     - BaseDBClient (Abstract Base Class)
     - QdrantDBClient (Qdrant implementation of BaseDBClient)
     - DBClient (Unified client interface)
+    - AsyncQdrantDBClient (asyncio counterpart of QdrantDBClient)
+    - AsyncDBClient (Unified asyncio client interface)
     - Custom Exceptions
 
 Author: Your Name
 """
 
+import asyncio
+import copy
+import itertools
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import grpc
+import httpx
+import numpy as np
 from darca_exception.exception import DarcaException
 from darca_log_facility.logger import DarcaLogger
-from qdrant_client import QdrantClient
-from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.http.models import Distance, PointStruct, VectorParams
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.exceptions import (
+    ResponseHandlingException,
+    UnexpectedResponse,
+)
+from qdrant_client.http.models import (
+    Batch,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+    PointStruct,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
+
+# Number of points sent per upsert request when inserting in bulk.
+UPSERT_BATCH_SIZE = 128
+
+# Maximum number of upsert requests the asynchronous client keeps in
+# flight during a bulk insert.
+UPSERT_CONCURRENCY = 4
+
+# Number of points sent per request when streaming uploads.
+UPLOAD_BATCH_SIZE = 256
+
+# Default number of search results kept in the in-process LRU cache. The
+# cache is disabled by default, since writes that do not go through the
+# same client instance never invalidate it.
+SEARCH_CACHE_SIZE = 0
+
+# Default cosine similarity above which a query is answered from the
+# semantic cache with the results of an earlier, similar query.
+SEMANTIC_CACHE_THRESHOLD = 0.86
+
+# Default number of retries for requests failing with a transient error,
+# and the delay in seconds before the first retry (doubled on each retry).
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.1
+
+_TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+_TRANSIENT_GRPC_CODES = frozenset(
+    {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+)
+
+# Supported distance metric names (upper-cased) and their Qdrant values.
+_DISTANCE_MAP = {
+    "COSINE": Distance.COSINE,
+    "EUCLIDEAN": Distance.EUCLID,
+    "EUCLID": Distance.EUCLID,
+    "DOT": Distance.DOT,
+    "MANHATTAN": Distance.MANHATTAN,
+}
+
+# Quantization schemes for stored vectors. The quantized copies are kept
+# in RAM for scoring; int8 ignores the most extreme 1% of values when
+# choosing the quantization range.
+_QUANTIZATION_MAP = {
+    "INT8": ScalarQuantization(
+        scalar=ScalarQuantizationConfig(
+            type=ScalarType.INT8, quantile=0.99, always_ram=True
+        )
+    ),
+    "BINARY": BinaryQuantization(
+        binary=BinaryQuantizationConfig(always_ram=True)
+    ),
+}
+
+# Vectors may be passed as plain lists or as NumPy arrays.
+Vector = Union[List[float], np.ndarray]
+VectorBatch = Union[List[List[float]], np.ndarray]
+
+# Point IDs are unsigned integers or UUID strings.
+PointId = Union[int, str]
+
+# Result type of a request passed to the retry helpers.
+T = TypeVar("T")
+
+
+# Qdrant clients shared per process, keyed on their connection settings.
+# Each entry holds the client and the number of QdrantDBClient instances
+# currently using it.
+_CLIENT_CACHE: Dict[Tuple[Any, ...], Tuple[QdrantClient, int]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yields consecutive slices of ``items`` holding ``size`` elements."""
+    for start in range(0, len(items), size):
+        end = start + size
+        yield items[start:end]
+
+
+def _dimensions(vectors: VectorBatch) -> Set[int]:
+    """Returns the distinct vector lengths found in a batch of vectors."""
+    if isinstance(vectors, np.ndarray):
+        return {vectors.shape[-1]} if vectors.size else set()
+    return {len(vector) for vector in vectors}
+
+
+def _get_shared_client(
+    host: str,
+    port: int,
+    grpc_port: int,
+    api_key: Optional[str],
+    prefer_grpc: bool,
+) -> Tuple[Tuple[Any, ...], QdrantClient]:
+    """
+    Returns the shared Qdrant client for the given connection settings.
+
+    A new client is constructed only when none exists yet for these
+    settings. Every call must be paired with
+    :func:`_release_shared_client`.
+    """
+    key = (host, port, grpc_port, api_key, prefer_grpc)
+    with _CLIENT_CACHE_LOCK:
+        client, refcount = _CLIENT_CACHE.get(key, (None, 0))
+        if client is None:
+            client = QdrantClient(
+                host=host,
+                port=port,
+                grpc_port=grpc_port,
+                prefer_grpc=prefer_grpc,
+                api_key=api_key,
+            )
+        _CLIENT_CACHE[key] = (client, refcount + 1)
+    return key, client
+
+
+def _release_shared_client(key: Tuple[Any, ...]) -> None:
+    """Drops one reference to a shared client, closing it on the last."""
+    with _CLIENT_CACHE_LOCK:
+        if key not in _CLIENT_CACHE:
+            return
+        client, refcount = _CLIENT_CACHE[key]
+        if refcount > 1:
+            _CLIENT_CACHE[key] = (client, refcount - 1)
+            return
+        del _CLIENT_CACHE[key]
+    client.close()
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Returns whether ``exc`` is a transient failure worth retrying.
+
+    Covers transport errors, gRPC ``UNAVAILABLE`` and
+    ``DEADLINE_EXCEEDED``, and HTTP responses signalling an overloaded
+    or unavailable server. Client errors such as a collection that
+    already exists are not retried.
+    """
+    if isinstance(exc, (httpx.TransportError, ResponseHandlingException)):
+        return True
+    if isinstance(exc, UnexpectedResponse):
+        return exc.status_code in _TRANSIENT_STATUS_CODES
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        return exc.code() in _TRANSIENT_GRPC_CODES
+    return False
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Returns whether ``exc`` reports that a resource does not exist."""
+    if isinstance(exc, UnexpectedResponse):
+        return exc.status_code == 404
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        return exc.code() == grpc.StatusCode.NOT_FOUND
+    return False
+
+
+def _is_conflict(exc: BaseException) -> bool:
+    """Returns whether ``exc`` reports that a resource already exists."""
+    if isinstance(exc, UnexpectedResponse):
+        return exc.status_code == 409
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        return exc.code() == grpc.StatusCode.ALREADY_EXISTS
+    return False
+
+
+def _to_float32(vector: Union[Vector, VectorBatch]) -> np.ndarray:
+    """
+    Returns ``vector`` as a C-contiguous float32 array.
+
+    No copy is made when the input already has that layout.
+    """
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+
+def _to_list(vector: Vector) -> List[float]:
+    """Returns ``vector`` as a list, converting arrays in one call."""
+    if isinstance(vector, np.ndarray):
+        return _to_float32(vector).tolist()
+    return vector
+
+
+class _SemanticCache:
+    """
+    Results of past searches, looked up by query similarity.
+
+    The unit-normalized query vectors are kept as rows of one ``(K, d)``
+    matrix, so that finding the most similar past query is a single
+    matrix-vector product. Once ``size`` queries are stored, the least
+    recently used one is overwritten.
+    """
+
+    def __init__(self, size: int, threshold: float):
+        self.size = size
+        self.threshold = threshold
+        # Allocated with the dimension of the first stored query.
+        self._centroids = np.empty((0, 0), dtype=np.float32)
+        self._results: List[Any] = []
+        self._last_used = np.zeros(size, dtype=np.int64)
+        self._clock = 0
+
+    def get(self, query: np.ndarray) -> Any:
+        """
+        Returns the results stored for the query most similar to
+        ``query``, or None when none reaches the threshold.
+        """
+        if not self._results:
+            return None
+        unit = self._normalize(query)
+        if unit is None:
+            return None
+        scores = self._centroids[: len(self._results)] @ unit
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        self._touch(best)
+        return self._results[best]
+
+    def put(self, query: np.ndarray, results: Any) -> None:
+        """Stores ``results`` for ``query``, evicting the oldest entry."""
+        if not self._centroids.size:
+            self._centroids = np.empty(
+                (self.size, query.shape[0]), dtype=np.float32
+            )
+        unit = self._normalize(query)
+        if unit is None:
+            return
+        if len(self._results) < self.size:
+            slot = len(self._results)
+            self._results.append(results)
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._results[slot] = results
+        self._centroids[slot] = unit
+        self._touch(slot)
+
+    def _normalize(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Returns ``query`` scaled to unit length.
+
+        Returns None for zero vectors and for queries whose dimension
+        differs from the stored ones, which the cache cannot compare.
+        """
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0 or query.shape[0] != self._centroids.shape[1]:
+            return None
+        return query / np.float32(norm)
+
+    def _touch(self, slot: int) -> None:
+        """Marks ``slot`` as the most recently used entry."""
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
 
 # === Custom Exceptions ===
 
@@ -63,6 +354,15 @@ class CollectionCreationError(DBClientException):
     pass
 
 
+class CollectionUpdateError(DBClientException):
+    """
+    Raised when updating the configuration of a collection in the vector
+    database fails.
+    """
+
+    pass
+
+
 class VectorInsertionError(DBClientException):
     """Raised when inserting a vector into a collection fails."""
 
@@ -94,14 +394,22 @@ class BaseDBClient(ABC):
     create_collection
         (name: str, vector_size: int, distance_metric: str) -> None
         Creates a new collection in the vector database.
-    insert_vector(collection_name: str, vector_id: str, vector: List[float],
+    insert_vector(collection_name: str, vector_id: PointId, vector: Vector,
         metadata: Optional[Dict[str, Any]]) -> None
         Inserts a vector into a specified collection.
+    insert_vectors(collection_name: str, ids: List[PointId], vectors:
+        VectorBatch, payloads: Optional[List[Dict[str, Any]]]) -> None
+        Inserts multiple vectors into a specified collection in batches.
     search_vectors(collection_name: str, query_vector:
-        List[float], top_k: int) -> Any
+        Vector, top_k: int) -> Any
         Searches for similar vectors within a collection.
+    search_vectors_batch(collection_name: str, query_vectors:
+        VectorBatch, top_k: int) -> List[Any]
+        Searches for similar vectors for several queries at once.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> None:
         """
@@ -144,6 +452,7 @@ class BaseDBClient(ABC):
                 - 'cosine'
                 - 'euclidean'
                 - 'dot'
+                - 'manhattan'
 
         Raises
         ------
@@ -160,8 +469,8 @@ class BaseDBClient(ABC):
     def insert_vector(
         self,
         collection_name: str,
-        vector_id: str,
-        vector: List[float],
+        vector_id: PointId,
+        vector: Vector,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
@@ -176,11 +485,11 @@ class BaseDBClient(ABC):
         ----------
         collection_name : str
             The name of the collection where the vector will be stored.
-        vector_id : str
+        vector_id : int or str
             A unique identifier for the vector. It must be unique within the
             collection.
-        vector : List[float]
-            The vector data to be inserted. The length of the list should
+        vector : List[float] or numpy.ndarray
+            The vector data to be inserted. The length of the vector should
             match the collection's vector size.
         metadata : dict, optional
             A dictionary of metadata to associate with the vector. Defaults
@@ -196,9 +505,46 @@ class BaseDBClient(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @abstractmethod
+    def insert_vectors(
+        self,
+        collection_name: str,
+        ids: List[PointId],
+        vectors: VectorBatch,
+        payloads: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Inserts multiple vectors into a specified collection.
+
+        This method adds a batch of vectors to an existing collection using
+        as few requests to the backend as possible. The ``ids``, ``vectors``
+        and ``payloads`` sequences are matched up by position.
+
+        Parameters
+        ----------
+        collection_name : str
+            The name of the collection where the vectors will be stored.
+        ids : List[int or str]
+            Unique identifiers for the vectors.
+        vectors : List[List[float]] or numpy.ndarray
+            The vector data to be inserted, one entry (row) per ID.
+        payloads : list of dict, optional
+            Metadata to associate with each vector. Defaults to None, in
+            which case no metadata is stored.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented by the subclass.
+        ValueError
+            If ``ids``, ``vectors`` and ``payloads`` differ in length, or
+            a vector size does not match the collection vector size.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
     @abstractmethod
     def search_vectors(
-        self, collection_name: str, query_vector: List[float], top_k: int = 10
+        self, collection_name: str, query_vector: Vector, top_k: int = 10
     ) -> Any:
         """
         Searches for similar vectors within a collection.
@@ -211,7 +557,7 @@ class BaseDBClient(ABC):
         ----------
         collection_name : str
             The name of the collection to search within.
-        query_vector : List[float]
+        query_vector : List[float] or numpy.ndarray
             The query vector used to perform the search. The length must
             match the collection's vector size.
         top_k : int, optional
@@ -234,103 +580,847 @@ class BaseDBClient(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @abstractmethod
+    def search_vectors_batch(
+        self,
+        collection_name: str,
+        query_vectors: VectorBatch,
+        top_k: int = 10,
+    ) -> List[Any]:
+        """
+        Searches for similar vectors for several queries at once.
+
+        This method sends all query vectors to the backend in a single
+        request, returning one result list per query in input order.
+
+        Parameters
+        ----------
+        collection_name : str
+            The name of the collection to search within.
+        query_vectors : List[List[float]] or numpy.ndarray
+            The query vectors, one entry (row) per query. Each must match
+            the collection's vector size.
+        top_k : int, optional
+            The number of most similar vectors to return per query.
+            Defaults to 10.
+
+        Returns
+        -------
+        List[Any]
+            The search results for each query, in the same order as
+            ``query_vectors``.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented by the subclass.
+        ValueError
+            If a query vector size does not match the expected
+            collection vector size.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
 
 # === Qdrant Implementation ===
 
 
-class QdrantDBClient(BaseDBClient):
+class _QdrantClientMixin:
     """
-    Implementation of the BaseDBClient for the Qdrant vector database.
+    Connection settings and client-side state shared by the synchronous
+    and asynchronous Qdrant clients.
 
-    Parameters
-    ----------
-    host : str
-        Host address of the Qdrant server.
-    port : int
-        Port number for the Qdrant server.
-    api_key : str, optional
-        API key for authentication.
+    Holds the search result cache and the collection vector sizes, and
+    builds the request models, so that the two clients only differ in how
+    they talk to the server.
+
+    The attributes are declared in ``__slots__``, so instances carry no
+    ``__dict__``.
     """
 
+    __slots__ = (
+        "logger",
+        "host",
+        "port",
+        "grpc_port",
+        "prefer_grpc",
+        "api_key",
+        "retries",
+        "retry_backoff",
+        "client",
+        "_client_key",
+        "_connect_lock",
+        "_dim_cache",
+        "search_cache_size",
+        "_search_cache",
+        "_search_cache_keys",
+        "_cache_lock",
+        "_cache_epoch",
+        "_cache_generations",
+        "semantic_cache_size",
+        "semantic_cache_threshold",
+        "_semantic_caches",
+    )
+
     def __init__(
         self,
         host: str = "localhost",
         port: int = 6333,
         api_key: Optional[str] = None,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
+        search_cache_size: int = SEARCH_CACHE_SIZE,
+        semantic_cache_size: int = 0,
+        semantic_cache_threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        retries: int = RETRY_ATTEMPTS,
+        retry_backoff: float = RETRY_BACKOFF,
     ):
         self.logger = DarcaLogger("darca-vector-db.qdrant").get_logger()
         self.host = os.getenv("DARCA_VECTORDB_HOST", host)
         self.port = int(os.getenv("DARCA_VECTORDB_PORT", port))
+        self.grpc_port = int(os.getenv("DARCA_VECTORDB_GRPC_PORT", grpc_port))
+        self.prefer_grpc = prefer_grpc
         self.api_key = api_key
-        self.client = None
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.client: Any = None
+        # Key of the shared client in use; only the synchronous client
+        # shares its underlying connection.
+        self._client_key: Optional[Tuple[Any, ...]] = None
+        # Held while connecting and closing, so that concurrent first calls
+        # acquire the shared client only once.
+        self._connect_lock = threading.Lock()
+        # Vector sizes by collection; None for collections with named
+        # vectors or that do not exist, so that the lookup is not repeated
+        # on every call.
+        self._dim_cache: Dict[str, Optional[int]] = {}
+        self.search_cache_size = int(
+            os.getenv("DARCA_VECTORDB_SEARCH_CACHE_SIZE", search_cache_size)
+        )
+        self._search_cache: OrderedDict[Tuple[str, bytes, int], Any] = (
+            OrderedDict()
+        )
+        self._search_cache_keys: Dict[str, Set[Tuple[str, bytes, int]]] = {}
+        # Guards the caches, which may be used from several threads.
+        self._cache_lock = threading.Lock()
+        # Bumped when the whole cache or one collection is invalidated,
+        # so that searches in flight at that moment are not cached.
+        self._cache_epoch = 0
+        self._cache_generations: Dict[str, int] = {}
+        self.semantic_cache_size = semantic_cache_size
+        self.semantic_cache_threshold = semantic_cache_threshold
+        # Semantic caches by collection and top_k.
+        self._semantic_caches: Dict[str, Dict[int, _SemanticCache]] = {}
+
+    def _retry(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Calls ``fn`` and retries it on transient errors.
 
-    def connect(self) -> None:
-        """Establishes a connection to the Qdrant server."""
-        try:
-            self.client = QdrantClient(
-                host=self.host, port=self.port, api_key=self.api_key
+        Waits ``retry_backoff`` seconds before the first retry and doubles
+        the delay on each further one; the last error is re-raised once
+        ``retries`` retries are used up.
+        """
+        delay = self.retry_backoff
+        for attempt in range(self.retries):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                if not _is_transient(exc):
+                    raise
+                self._log_retry(attempt, delay)
+            time.sleep(delay)
+            delay *= 2
+        return fn(*args, **kwargs)
+
+    async def _retry_async(
+        self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Awaits ``fn`` and retries it on transient errors like _retry."""
+        delay = self.retry_backoff
+        for attempt in range(self.retries):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as exc:
+                if not _is_transient(exc):
+                    raise
+                self._log_retry(attempt, delay)
+            await asyncio.sleep(delay)
+            delay *= 2
+        return await fn(*args, **kwargs)
+
+    def _log_retry(self, attempt: int, delay: float) -> None:
+        """Logs a retry after a transient error."""
+        self.logger.warning(
+            "Transient error from Qdrant, retrying in %.2fs (%d/%d).",
+            delay,
+            attempt + 1,
+            self.retries,
+            exc_info=True,
+        )
+
+    def clear_dimension_cache(
+        self, collection_name: Optional[str] = None
+    ) -> None:
+        """
+        Forgets cached collection vector sizes.
+
+        Only the size of ``collection_name`` is dropped when given,
+        otherwise all of them. Call it after a collection was recreated
+        with another size outside this client; the size is fetched again
+        on its next use.
+        """
+        if collection_name is None:
+            self._dim_cache.clear()
+        else:
+            self._dim_cache.pop(collection_name, None)
+
+    def clear_search_cache(
+        self, collection_name: Optional[str] = None
+    ) -> None:
+        """
+        Drops cached search results.
+
+        Only the entries for ``collection_name`` are dropped when given,
+        otherwise the whole cache is cleared. Results of searches still
+        in flight are not cached afterwards.
+        """
+        with self._cache_lock:
+            if collection_name is None:
+                self._cache_epoch += 1
+                self._search_cache.clear()
+                self._search_cache_keys.clear()
+                self._semantic_caches.clear()
+                return
+            self._cache_generations[collection_name] = (
+                self._cache_generations.get(collection_name, 0) + 1
             )
-            self.logger.info(
-                f"Successfully connected to Qdrant at {self.host}:{self.port}"
+            for key in self._search_cache_keys.pop(collection_name, ()):
+                self._search_cache.pop(key, None)
+            self._semantic_caches.pop(collection_name, None)
+
+    def _cache_generation(self, collection_name: str) -> Tuple[int, int]:
+        """Returns the invalidation count of ``collection_name``."""
+        return (
+            self._cache_epoch,
+            self._cache_generations.get(collection_name, 0),
+        )
+
+    def _cached_search(
+        self, collection_name: str, query_vector: Vector, top_k: int
+    ) -> Tuple[Optional[Tuple[Tuple[str, bytes, int], Tuple[int, int]]], Any]:
+        """
+        Looks up a search in the exact and then in the semantic cache.
+
+        Returns a ticket for storing the results (None when both caches
+        are disabled) and a copy of the cached results, or None on a miss.
+        The ticket records the collection's invalidation count, so that
+        results arriving after an invalidation are discarded.
+        """
+        if self.search_cache_size <= 0 and self.semantic_cache_size <= 0:
+            return None, None
+        key = (collection_name, _to_float32(query_vector).tobytes(), top_k)
+        with self._cache_lock:
+            ticket = (key, self._cache_generation(collection_name))
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
+                source = "cache"
+            elif self.semantic_cache_size > 0:
+                cached = self._semantic_cache_get(key)
+                if cached is None:
+                    return ticket, None
+                source = "semantic cache"
+            else:
+                return ticket, None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Search served from %s for collection '%s'.",
+                source,
+                collection_name,
             )
-        except Exception:
-            self.logger.error("Connection to Qdrant failed", exc_info=True)
-            raise DBConnectionError(
-                "Failed to connect to Qdrant server", "DB_CONN_ERROR"
+        return ticket, copy.deepcopy(cached)
+
+    def _cache_search_result(
+        self,
+        ticket: Tuple[Tuple[str, bytes, int], Tuple[int, int]],
+        results: Any,
+    ) -> None:
+        """
+        Stores ``results`` under the ticket's key, evicting the oldest
+        entry, unless the collection was invalidated in the meantime.
+
+        Both caches share one copy of the results; hits are copied again
+        on the way out.
+        """
+        key, generation = ticket
+        collection_name, query, top_k = key
+        stored = copy.deepcopy(results)
+        with self._cache_lock:
+            if self._cache_generation(collection_name) != generation:
+                return
+            if self.semantic_cache_size > 0:
+                self._semantic_caches.setdefault(
+                    collection_name, {}
+                ).setdefault(
+                    top_k,
+                    _SemanticCache(
+                        self.semantic_cache_size,
+                        self.semantic_cache_threshold,
+                    ),
+                ).put(
+                    np.frombuffer(query, dtype=np.float32), stored
+                )
+            if self.search_cache_size <= 0:
+                return
+            self._search_cache[key] = stored
+            self._search_cache_keys.setdefault(collection_name, set()).add(key)
+            if len(self._search_cache) > self.search_cache_size:
+                evicted, _ = self._search_cache.popitem(last=False)
+                self._search_cache_keys[evicted[0]].discard(evicted)
+
+    def _semantic_cache_get(self, key: Tuple[str, bytes, int]) -> Any:
+        """Returns the results of a similar past query, if any."""
+        collection_name, query, top_k = key
+        cache = self._semantic_caches.get(collection_name, {}).get(top_k)
+        if cache is None:
+            return None
+        return cache.get(np.frombuffer(query, dtype=np.float32))
+
+    @staticmethod
+    def _size_from_info(info: Any) -> Optional[int]:
+        """
+        Extracts the vector size from a collection info response.
+
+        Returns None for collections with named vectors, which have no
+        single size.
+        """
+        size = getattr(info.config.params.vectors, "size", None)
+        return size if isinstance(size, int) else None
+
+    @staticmethod
+    def _validate_sizes(
+        collection_name: str, expected: Optional[int], sizes: Set[int]
+    ) -> None:
+        """Raises ValueError if any of ``sizes`` mismatches ``expected``."""
+        if expected is None:
+            return
+        for size in sizes:
+            if size != expected:
+                raise ValueError(
+                    f"Vector dimension {size} does not match the dimension "
+                    f"{expected} of collection '{collection_name}'"
+                )
+
+    @staticmethod
+    def _collection_config(
+        vector_size: int,
+        distance_metric: str,
+        bulk_load: bool,
+        indexing_threshold: Optional[int],
+        quantization: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Builds the keyword arguments for creating a collection."""
+        distance = _DISTANCE_MAP.get(distance_metric.upper())
+        if distance is None:
+            raise ValueError(f"Unsupported distance metric: {distance_metric}")
+        quantization_config = None
+        if quantization is not None:
+            quantization_config = _QUANTIZATION_MAP.get(quantization.upper())
+            if quantization_config is None:
+                raise ValueError(f"Unsupported quantization: {quantization}")
+        hnsw_config = None
+        optimizers_config = None
+        if bulk_load:
+            hnsw_config = HnswConfigDiff(m=0)
+            if indexing_threshold is None:
+                indexing_threshold = 0
+        if indexing_threshold is not None:
+            optimizers_config = OptimizersConfigDiff(
+                indexing_threshold=indexing_threshold
+            )
+        return {
+            "vectors_config": VectorParams(
+                size=vector_size, distance=distance
+            ),
+            "hnsw_config": hnsw_config,
+            "optimizers_config": optimizers_config,
+            "quantization_config": quantization_config,
+        }
+
+    @staticmethod
+    def _index_config(m: int, indexing_threshold: int) -> Dict[str, Any]:
+        """Builds the keyword arguments for re-enabling indexing."""
+        return {
+            "hnsw_config": HnswConfigDiff(m=m),
+            "optimizers_config": OptimizersConfigDiff(
+                indexing_threshold=indexing_threshold
+            ),
+        }
+
+    @staticmethod
+    def _check_lengths(
+        ids: List[PointId],
+        vectors: VectorBatch,
+        payloads: Optional[List[Optional[Dict[str, Any]]]],
+    ) -> None:
+        """Ensures ``ids``, ``vectors`` and ``payloads`` line up."""
+        lengths = {len(ids), len(vectors)}
+        if payloads is not None:
+            lengths.add(len(payloads))
+        if len(lengths) > 1:
+            raise ValueError(
+                "ids, vectors and payloads must have the same length"
             )
 
+    @staticmethod
+    def _build_batches(
+        ids: List[PointId],
+        vectors: VectorBatch,
+        payloads: Optional[List[Optional[Dict[str, Any]]]],
+        batch_size: int,
+    ) -> List[Batch]:
+        """
+        Splits ``ids``, ``vectors`` and ``payloads`` into column batches.
+
+        Each ``Batch`` holds the parallel lists of one chunk, so a chunk
+        costs a single model validation instead of one per point.
+        """
+        # Convert a whole matrix in one call rather than row by row.
+        rows: List[List[float]] = (
+            _to_float32(vectors).tolist()
+            if isinstance(vectors, np.ndarray)
+            else vectors
+        )
+        payload_chunks: Iterable[Optional[List[Any]]]
+        if payloads is not None:
+            payload_chunks = _chunked(payloads, batch_size)
+        else:
+            payload_chunks = itertools.repeat(None)
+        return [
+            Batch(
+                ids=chunk_ids, vectors=chunk_vectors, payloads=chunk_payloads
+            )
+            for chunk_ids, chunk_vectors, chunk_payloads in zip(
+                _chunked(ids, batch_size),
+                _chunked(rows, batch_size),
+                payload_chunks,
+            )
+        ]
+
+    @staticmethod
+    def _query_requests(
+        query_vectors: VectorBatch, top_k: int
+    ) -> List[QueryRequest]:
+        """Builds one query request per row of ``query_vectors``."""
+        return [
+            QueryRequest(query=query, limit=top_k, with_payload=True)
+            for query in _to_float32(query_vectors).tolist()
+        ]
+
+
+class QdrantDBClient(_QdrantClientMixin, BaseDBClient):
+    """
+    Implementation of the BaseDBClient for the Qdrant vector database.
+
+    Parameters
+    ----------
+    host : str
+        Host address of the Qdrant server.
+    port : int
+        Port number for the Qdrant server.
+    api_key : str, optional
+        API key for authentication.
+    grpc_port : int
+        gRPC port number for the Qdrant server.
+    prefer_grpc : bool
+        Whether to use gRPC instead of HTTP/JSON for requests
+        (default: True).
+    search_cache_size : int
+        Maximum number of search results kept in the in-process LRU cache
+        (default: 0, disabled). Only inserts through this instance
+        invalidate it, so enable it only when no other writer changes
+        the collections searched.
+    semantic_cache_size : int
+        Number of past queries per collection and ``top_k`` whose results
+        are reused for similar queries. Set to a positive value to enable
+        the semantic cache (default: 0, disabled).
+    semantic_cache_threshold : float
+        Cosine similarity a query must reach with a past query to be
+        answered from the semantic cache (default: 0.86).
+    retries : int
+        Number of retries for requests failing with a transient error,
+        such as a dropped connection or an unavailable server (default: 3).
+    retry_backoff : float
+        Delay in seconds before the first retry, doubled on each further
+        retry (default: 0.1).
+    """
+
+    __slots__ = ()
+
+    client: Optional[QdrantClient]
+
+    def connect(self) -> None:
+        """
+        Establishes a connection to the Qdrant server.
+
+        Instances with the same connection settings share one underlying
+        ``QdrantClient`` and its connection pool within the process.
+        Calling this method on a connected client does nothing, and the
+        other methods connect on first use.
+        """
+        self._connect()
+
+    def _connect(self) -> QdrantClient:
+        """Connects unless already connected and returns the client."""
+        with self._connect_lock:
+            if self.client is not None:
+                return self.client
+            try:
+                self._client_key, self.client = _get_shared_client(
+                    self.host,
+                    self.port,
+                    self.grpc_port,
+                    self.api_key,
+                    self.prefer_grpc,
+                )
+                self.logger.info(
+                    "Successfully connected to Qdrant at %s:%s",
+                    self.host,
+                    self.port,
+                )
+            except Exception:
+                self.logger.error("Connection to Qdrant failed", exc_info=True)
+                raise DBConnectionError(
+                    "Failed to connect to Qdrant server", "DB_CONN_ERROR"
+                )
+            return self.client
+
+    def close(self) -> None:
+        """
+        Releases the connection to the Qdrant server.
+
+        The shared ``QdrantClient`` is closed once no other instance uses
+        it anymore.
+        """
+        with self._connect_lock:
+            if self._client_key is not None:
+                _release_shared_client(self._client_key)
+                self._client_key = None
+            self.client = None
+
+    def _ensure_connected(self) -> QdrantClient:
+        """
+        Returns the Qdrant client, connecting first unless connected.
+
+        The connection state is checked again under the lock, so
+        concurrent first calls share a single connection.
+        """
+        if self.client is not None:
+            return self.client
+        return self._connect()
+
+    def _vector_size(self, collection_name: str) -> Optional[int]:
+        """
+        Returns the vector size of a collection, fetching it once if needed.
+
+        Returns None when the size cannot be determined; the server then
+        validates. Sizes, and the absence of one for collections with
+        named vectors or that do not exist, are remembered until
+        :meth:`clear_dimension_cache` is called or the collection is
+        created through this client. Other failures are not remembered.
+        """
+        if collection_name in self._dim_cache:
+            return self._dim_cache[collection_name]
+        client = self._ensure_connected()
+        try:
+            info = client.get_collection(collection_name)
+        except Exception as exc:
+            if not _is_not_found(exc):
+                return None
+            size = None
+        else:
+            size = self._size_from_info(info)
+        self._dim_cache[collection_name] = size
+        return size
+
+    def _check_dimension(self, collection_name: str, sizes: Set[int]) -> None:
+        """Raises ValueError if any of ``sizes`` mismatches the collection."""
+        self._validate_sizes(
+            collection_name, self._vector_size(collection_name), sizes
+        )
+
     def create_collection(
-        self, name: str, vector_size: int, distance_metric: str = "cosine"
+        self,
+        name: str,
+        vector_size: int,
+        distance_metric: str = "cosine",
+        bulk_load: bool = False,
+        indexing_threshold: Optional[int] = None,
+        quantization: Optional[str] = None,
     ) -> None:
-        """Creates a collection in Qdrant."""
+        """
+        Creates a collection in Qdrant.
+
+        With ``bulk_load`` enabled the HNSW graph (``m=0``) and vector
+        indexing (``indexing_threshold=0``) are disabled so that ingestion
+        does not pay for index construction. Call :meth:`finalize_index`
+        once loading is done to build the index for search.
+        ``indexing_threshold`` overrides the server default (in kilobytes).
+
+        ``quantization`` stores a compressed copy of the vectors for
+        scoring: ``"int8"`` scalar quantization uses a quarter of the
+        memory of float32, ``"binary"`` one bit per dimension.
+
+        A request that times out may still have created the collection,
+        so a conflict on a retry is accepted once the collection is
+        confirmed to exist.
+        """
+        client = self._ensure_connected()
+        self.clear_search_cache(name)
+        self.clear_dimension_cache(name)
+        config = self._collection_config(
+            vector_size,
+            distance_metric,
+            bulk_load,
+            indexing_threshold,
+            quantization,
+        )
+        vectors_config = config.pop("vectors_config")
+        transient_failure = False
+
+        def create() -> None:
+            nonlocal transient_failure
+            try:
+                client.create_collection(name, vectors_config, **config)
+            except Exception as exc:
+                if (
+                    transient_failure
+                    and _is_conflict(exc)
+                    and client.collection_exists(name)
+                ):
+                    return
+                transient_failure = transient_failure or _is_transient(exc)
+                raise
+
         try:
-            distance = getattr(Distance, distance_metric.upper())
-            self.client.create_collection(
-                name, VectorParams(size=vector_size, distance=distance)
-            )
-            self.logger.info(f"Collection '{name}' created successfully.")
-        except AttributeError:
-            raise ValueError(f"Unsupported distance metric: {distance_metric}")
-        except UnexpectedResponse:
+            self._retry(create)
+            self._dim_cache[name] = vector_size
+            self.logger.info("Collection '%s' created successfully.", name)
+        except Exception:
             self.logger.error("Failed to create collection", exc_info=True)
             raise CollectionCreationError(
                 "Failed to create collection", "COLLECTION_CREATION_ERROR"
             )
 
+    def finalize_index(
+        self, name: str, m: int = 16, indexing_threshold: int = 20000
+    ) -> None:
+        """
+        Re-enables indexing on a collection created with ``bulk_load``.
+
+        Restores the HNSW graph degree ``m`` and the ``indexing_threshold``
+        so that Qdrant builds the search index in one pass.
+        """
+        client = self._ensure_connected()
+        try:
+            client.update_collection(
+                name, **self._index_config(m, indexing_threshold)
+            )
+            self.logger.info("Index for collection '%s' finalized.", name)
+        except Exception:
+            self.logger.error("Failed to finalize index", exc_info=True)
+            raise CollectionUpdateError(
+                "Failed to finalize index", "COLLECTION_UPDATE_ERROR"
+            )
+
     def insert_vector(
         self,
         collection_name: str,
-        vector_id: int,
-        vector: List[float],
+        vector_id: PointId,
+        vector: Vector,
         metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = False,
     ) -> None:
-        """Inserts a vector into the Qdrant collection."""
+        """
+        Inserts a vector into the Qdrant collection.
+
+        The request returns once the point is accepted by the server; pass
+        ``wait=True`` to block until it has been applied.
+        """
+        client = self._ensure_connected()
+        self.clear_search_cache(collection_name)
+        self._check_dimension(collection_name, {len(vector)})
         try:
-            point = PointStruct(id=vector_id, vector=vector, payload=metadata)
-            self.client.upsert(collection_name=collection_name, points=[point])
-            self.logger.info(
-                f"Vector with ID '{vector_id}' inserted successfully "
-                f"into '{collection_name}'."
+            point = PointStruct(
+                id=vector_id, vector=_to_list(vector), payload=metadata
+            )
+            self._retry(
+                client.upsert,
+                collection_name=collection_name,
+                points=[point],
+                wait=wait,
             )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Vector with ID '%s' inserted successfully into '%s'.",
+                    vector_id,
+                    collection_name,
+                )
         except Exception:
             self.logger.error("Failed to insert vector", exc_info=True)
             raise VectorInsertionError(
                 "Failed to insert vector", "VECTOR_INSERTION_ERROR"
             )
 
+    def insert_vectors(
+        self,
+        collection_name: str,
+        ids: List[PointId],
+        vectors: VectorBatch,
+        payloads: Optional[List[Optional[Dict[str, Any]]]] = None,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        wait: bool = False,
+    ) -> None:
+        """
+        Inserts multiple vectors into the Qdrant collection.
+
+        Points are sent in chunks of ``batch_size`` per upsert request
+        instead of one request per vector. Pass ``wait=True`` to block
+        until each chunk has been applied.
+        """
+        client = self._ensure_connected()
+        self._check_dimension(collection_name, _dimensions(vectors))
+        self._check_lengths(ids, vectors, payloads)
+        self.clear_search_cache(collection_name)
+        try:
+            batches = self._build_batches(ids, vectors, payloads, batch_size)
+            for batch in batches:
+                self._retry(
+                    client.upsert,
+                    collection_name=collection_name,
+                    points=batch,
+                    wait=wait,
+                )
+            self.logger.info(
+                "%d vectors inserted successfully into '%s'.",
+                len(ids),
+                collection_name,
+            )
+        except Exception:
+            self.logger.error("Failed to insert vectors", exc_info=True)
+            raise VectorInsertionError(
+                "Failed to insert vectors", "VECTOR_INSERTION_ERROR"
+            )
+
+    def upload_stream(
+        self,
+        collection_name: str,
+        points: Iterable[Tuple[PointId, Vector, Optional[Dict[str, Any]]]],
+        batch_size: int = UPLOAD_BATCH_SIZE,
+        parallel: Optional[int] = None,
+    ) -> None:
+        """
+        Uploads a stream of ``(id, vector, payload)`` tuples to Qdrant.
+
+        The points are consumed lazily and uploaded by qdrant-client in
+        batches of ``batch_size`` over ``parallel`` workers (default: the
+        number of CPUs), with retries and without waiting for indexing.
+        Suited for imports too large to hold in memory.
+        """
+        client = self._ensure_connected()
+        self.clear_search_cache(collection_name)
+
+        def generate() -> Iterator[PointStruct]:
+            for point_id, vector, payload in points:
+                yield PointStruct(
+                    id=point_id, vector=_to_list(vector), payload=payload
+                )
+
+        try:
+            client.upload_points(
+                collection_name=collection_name,
+                points=generate(),
+                batch_size=batch_size,
+                parallel=parallel or os.cpu_count() or 1,
+                wait=False,
+            )
+            self.logger.info(
+                "Upload stream completed successfully into '%s'.",
+                collection_name,
+            )
+        except Exception:
+            self.logger.error("Failed to upload vectors", exc_info=True)
+            raise VectorInsertionError(
+                "Failed to upload vectors", "VECTOR_INSERTION_ERROR"
+            )
+
     def search_vectors(
-        self, collection_name: str, query_vector: List[float], top_k: int = 10
+        self, collection_name: str, query_vector: Vector, top_k: int = 10
     ) -> Any:
-        """Searches for similar vectors within the Qdrant collection."""
+        """
+        Searches for similar vectors within the Qdrant collection.
+
+        Results are kept in an LRU cache keyed on the collection, the
+        float32 bytes of the query and ``top_k``. Inserting into or
+        recreating a collection drops its cached results.
+
+        The query is converted to a float32 array once and that array is
+        used both as the cache key and as the request vector.
+        """
+        client = self._ensure_connected()
+        query_vector = _to_float32(query_vector)
+        key, cached = self._cached_search(collection_name, query_vector, top_k)
+        if cached is not None:
+            return cached
+        self._check_dimension(collection_name, {len(query_vector)})
+        try:
+            results = self._retry(
+                client.query_points,
+                collection_name,
+                query=query_vector,
+                limit=top_k,
+            ).points
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Search completed successfully in collection '%s'.",
+                    collection_name,
+                )
+        except Exception:
+            self.logger.error("Failed to search vectors", exc_info=True)
+            raise VectorSearchError(
+                "Failed to search vectors", "VECTOR_SEARCH_ERROR"
+            )
+        if key is not None:
+            self._cache_search_result(key, results)
+        return results
+
+    def search_vectors_batch(
+        self,
+        collection_name: str,
+        query_vectors: VectorBatch,
+        top_k: int = 10,
+    ) -> List[Any]:
+        """
+        Searches for similar vectors for several queries in one request.
+
+        Returns one list of scored points per query. Batched searches
+        bypass the search cache.
+        """
+        client = self._ensure_connected()
+        self._check_dimension(collection_name, _dimensions(query_vectors))
         try:
-            results = self.client.search(
-                collection_name, query_vector, limit=top_k
+            requests = self._query_requests(query_vectors, top_k)
+            responses = self._retry(
+                client.query_batch_points,
+                collection_name=collection_name,
+                requests=requests,
             )
             self.logger.info(
-                f"Search completed successfully in collection "
-                f"'{collection_name}'."
+                "Batch search of %d queries completed successfully in "
+                "collection '%s'.",
+                len(requests),
+                collection_name,
             )
-            return results
+            return [response.points for response in responses]
         except Exception:
             self.logger.error("Failed to search vectors", exc_info=True)
             raise VectorSearchError(
@@ -345,6 +1435,12 @@ class DBClient:
     """
     A unified client for interacting with vector databases.
 
+    The per-vector operations ``insert_vector``, ``insert_vectors``,
+    ``search_vectors`` and ``search_vectors_batch`` are bound directly to
+    the backend's methods, so calls do not pass through a wrapper frame.
+    See :class:`BaseDBClient` for their documentation. Messages are
+    logged through the backend's logger.
+
     Parameters
     ----------
     backend : str
@@ -353,8 +1449,15 @@ class DBClient:
         Additional parameters for backend initialization.
     """
 
-    def __init__(self, backend: str = "qdrant", **kwargs):
-        self.logger = DarcaLogger("darca-vector-db").get_logger()
+    __slots__ = (
+        "_client",
+        "insert_vector",
+        "insert_vectors",
+        "search_vectors",
+        "search_vectors_batch",
+    )
+
+    def __init__(self, backend: str = "qdrant", **kwargs: Any) -> None:
         if backend == "qdrant":
             self._client = QdrantDBClient(**kwargs)
         else:
@@ -362,14 +1465,22 @@ class DBClient:
                 f"Backend '{backend}' is not supported",
                 "DB_UNSUPPORTED_BACKEND",
             )
+        self.insert_vector = self._client.insert_vector
+        self.insert_vectors = self._client.insert_vectors
+        self.search_vectors = self._client.search_vectors
+        self.search_vectors_batch = self._client.search_vectors_batch
 
     def connect(self) -> None:
         """Establishes a connection to the vector database."""
         self._client.connect()
-        self.logger.info("Connected to the vector database.")
+        self._client.logger.info("Connected to the vector database.")
 
     def create_collection(
-        self, name: str, vector_size: int, distance_metric: str = "cosine"
+        self,
+        name: str,
+        vector_size: int,
+        distance_metric: str = "cosine",
+        **kwargs: Any,
     ) -> None:
         """
         Creates a new collection in the vector database.
@@ -383,6 +1494,9 @@ class DBClient:
         distance_metric : str
             The distance metric to use for vector comparisons
             (default: 'cosine').
+        kwargs : dict
+            Backend-specific options, e.g. ``bulk_load`` or ``quantization``
+            for Qdrant.
         Raises
         -------
         ValueError
@@ -390,68 +1504,408 @@ class DBClient:
         CollectionCreationError
             If the collection creation fails.
         """
-        self._client.create_collection(name, vector_size, distance_metric)
-        self.logger.info(f"Collection '{name}' created.")
+        self._client.create_collection(
+            name, vector_size, distance_metric, **kwargs
+        )
+        self._client.logger.info("Collection '%s' created.", name)
 
-    def insert_vector(
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+# === Asynchronous Qdrant Implementation ===
+
+
+class AsyncQdrantDBClient(_QdrantClientMixin):
+    """
+    Asynchronous counterpart of :class:`QdrantDBClient`.
+
+    Backed by ``AsyncQdrantClient``, so that many upserts and searches can
+    be in flight on a single event loop. The methods mirror those of
+    :class:`QdrantDBClient` as coroutines, and the search cache and
+    dimension validation behave the same.
+
+    Each instance owns its ``AsyncQdrantClient``; unlike the synchronous
+    client it is not shared, since it is bound to the event loop it was
+    created on.
+
+    The constructor takes the same parameters as :class:`QdrantDBClient`.
+    """
+
+    __slots__ = ()
+
+    client: Optional[AsyncQdrantClient]
+
+    async def connect(self) -> None:
+        """
+        Establishes a connection to the Qdrant server.
+
+        Calling this method on a connected client does nothing, and the
+        other methods connect on first use.
+        """
+        await self._connect()
+
+    async def _connect(self) -> AsyncQdrantClient:
+        """Connects unless already connected and returns the client."""
+        if self.client is not None:
+            return self.client
+        try:
+            self.client = AsyncQdrantClient(
+                host=self.host,
+                port=self.port,
+                grpc_port=self.grpc_port,
+                prefer_grpc=self.prefer_grpc,
+                api_key=self.api_key,
+            )
+            self.logger.info(
+                "Successfully connected to Qdrant at %s:%s",
+                self.host,
+                self.port,
+            )
+        except Exception:
+            self.logger.error("Connection to Qdrant failed", exc_info=True)
+            raise DBConnectionError(
+                "Failed to connect to Qdrant server", "DB_CONN_ERROR"
+            )
+        return self.client
+
+    async def close(self) -> None:
+        """Closes the connection to the Qdrant server."""
+        if self.client is not None:
+            client, self.client = self.client, None
+            await client.close()
+
+    async def _ensure_connected(self) -> AsyncQdrantClient:
+        """Returns the Qdrant client, connecting first unless connected."""
+        if self.client is not None:
+            return self.client
+        return await self._connect()
+
+    async def _vector_size(self, collection_name: str) -> Optional[int]:
+        """
+        Returns the vector size of a collection, fetching it once if needed.
+
+        Returns None when the size cannot be determined; the server then
+        validates. Sizes, and the absence of one for collections with
+        named vectors or that do not exist, are remembered until
+        :meth:`clear_dimension_cache` is called or the collection is
+        created through this client. Other failures are not remembered.
+        """
+        if collection_name in self._dim_cache:
+            return self._dim_cache[collection_name]
+        client = await self._ensure_connected()
+        try:
+            info = await client.get_collection(collection_name)
+        except Exception as exc:
+            if not _is_not_found(exc):
+                return None
+            size = None
+        else:
+            size = self._size_from_info(info)
+        self._dim_cache[collection_name] = size
+        return size
+
+    async def _check_dimension(
+        self, collection_name: str, sizes: Set[int]
+    ) -> None:
+        """Raises ValueError if any of ``sizes`` mismatches the collection."""
+        self._validate_sizes(
+            collection_name, await self._vector_size(collection_name), sizes
+        )
+
+    async def create_collection(
+        self,
+        name: str,
+        vector_size: int,
+        distance_metric: str = "cosine",
+        bulk_load: bool = False,
+        indexing_threshold: Optional[int] = None,
+        quantization: Optional[str] = None,
+    ) -> None:
+        """
+        Creates a collection in Qdrant.
+
+        See :meth:`QdrantDBClient.create_collection`.
+        """
+        client = await self._ensure_connected()
+        self.clear_search_cache(name)
+        self.clear_dimension_cache(name)
+        config = self._collection_config(
+            vector_size,
+            distance_metric,
+            bulk_load,
+            indexing_threshold,
+            quantization,
+        )
+        vectors_config = config.pop("vectors_config")
+        transient_failure = False
+
+        async def create() -> None:
+            nonlocal transient_failure
+            try:
+                await client.create_collection(name, vectors_config, **config)
+            except Exception as exc:
+                if (
+                    transient_failure
+                    and _is_conflict(exc)
+                    and await client.collection_exists(name)
+                ):
+                    return
+                transient_failure = transient_failure or _is_transient(exc)
+                raise
+
+        try:
+            await self._retry_async(create)
+            self._dim_cache[name] = vector_size
+            self.logger.info("Collection '%s' created successfully.", name)
+        except Exception:
+            self.logger.error("Failed to create collection", exc_info=True)
+            raise CollectionCreationError(
+                "Failed to create collection", "COLLECTION_CREATION_ERROR"
+            )
+
+    async def finalize_index(
+        self, name: str, m: int = 16, indexing_threshold: int = 20000
+    ) -> None:
+        """
+        Re-enables indexing on a collection created with ``bulk_load``.
+
+        See :meth:`QdrantDBClient.finalize_index`.
+        """
+        client = await self._ensure_connected()
+        try:
+            await client.update_collection(
+                name, **self._index_config(m, indexing_threshold)
+            )
+            self.logger.info("Index for collection '%s' finalized.", name)
+        except Exception:
+            self.logger.error("Failed to finalize index", exc_info=True)
+            raise CollectionUpdateError(
+                "Failed to finalize index", "COLLECTION_UPDATE_ERROR"
+            )
+
+    async def insert_vector(
         self,
         collection_name: str,
-        vector_id: str,
-        vector: List[float],
+        vector_id: PointId,
+        vector: Vector,
         metadata: Optional[Dict[str, Any]] = None,
+        wait: bool = False,
+    ) -> None:
+        """Inserts a vector into the Qdrant collection."""
+        client = await self._ensure_connected()
+        self.clear_search_cache(collection_name)
+        await self._check_dimension(collection_name, {len(vector)})
+        try:
+            point = PointStruct(
+                id=vector_id, vector=_to_list(vector), payload=metadata
+            )
+            await self._retry_async(
+                client.upsert,
+                collection_name=collection_name,
+                points=[point],
+                wait=wait,
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Vector with ID '%s' inserted successfully into '%s'.",
+                    vector_id,
+                    collection_name,
+                )
+        except Exception:
+            self.logger.error("Failed to insert vector", exc_info=True)
+            raise VectorInsertionError(
+                "Failed to insert vector", "VECTOR_INSERTION_ERROR"
+            )
+
+    async def insert_vectors(
+        self,
+        collection_name: str,
+        ids: List[PointId],
+        vectors: VectorBatch,
+        payloads: Optional[List[Optional[Dict[str, Any]]]] = None,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        wait: bool = False,
+        max_concurrency: int = UPSERT_CONCURRENCY,
     ) -> None:
         """
-        Inserts a vector into the specified collection.
-        Parameters
-        ----------
-        collection_name : str
-            The name of the collection to insert the vector into.
-        vector_id : str
-            The unique ID for the vector.
-        vector : list[float]
-            The vector data to insert.
-        metadata : dict, optional
-            Additional metadata to associate with the vector.
-        Raises
-        VectorInsertionError
-            If the vector insertion fails.
+        Inserts multiple vectors into the Qdrant collection.
+
+        The chunks of ``batch_size`` points are upserted concurrently, with
+        at most ``max_concurrency`` requests in flight, so the order in
+        which they are applied is not guaranteed.
         """
-        self._client.insert_vector(
-            collection_name, vector_id, vector, metadata
-        )
-        self.logger.info(
-            f"Vector '{vector_id}' inserted into collection "
-            f"'{collection_name}'."
-        )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        client = await self._ensure_connected()
+        await self._check_dimension(collection_name, _dimensions(vectors))
+        self._check_lengths(ids, vectors, payloads)
+        self.clear_search_cache(collection_name)
+        try:
+            batches = iter(
+                self._build_batches(ids, vectors, payloads, batch_size)
+            )
 
-    def search_vectors(
-        self, collection_name: str, query_vector: List[float], top_k: int = 10
+            async def upsert_batches() -> None:
+                # The workers share one iterator, each taking the next
+                # chunk once its previous upsert has completed.
+                for batch in batches:
+                    await self._retry_async(
+                        client.upsert,
+                        collection_name=collection_name,
+                        points=batch,
+                        wait=wait,
+                    )
+
+            # On the first failure the task group cancels the other
+            # workers, so no chunks are sent after the error is raised.
+            async with asyncio.TaskGroup() as group:
+                for _ in range(max_concurrency):
+                    group.create_task(upsert_batches())
+            self.logger.info(
+                "%d vectors inserted successfully into '%s'.",
+                len(ids),
+                collection_name,
+            )
+        except Exception:
+            self.logger.error("Failed to insert vectors", exc_info=True)
+            raise VectorInsertionError(
+                "Failed to insert vectors", "VECTOR_INSERTION_ERROR"
+            )
+
+    async def search_vectors(
+        self, collection_name: str, query_vector: Vector, top_k: int = 10
     ) -> Any:
         """
-        Searches for similar vectors in the specified collection.
-        Parameters
-        ----------
-        collection_name : str
-            The name of the collection to search.
-        query_vector : list[float]
-            The vector to search for.
-        top_k : int
-            The number of similar vectors to return (default: 10).
-        Returns
-        -------
-        Any
-            The search results.
-        Raises
-        VectorSearchError
-            If the vector search fails.
+        Searches for similar vectors within the Qdrant collection.
+
+        See :meth:`QdrantDBClient.search_vectors`.
+        """
+        client = await self._ensure_connected()
+        query_vector = _to_float32(query_vector)
+        key, cached = self._cached_search(collection_name, query_vector, top_k)
+        if cached is not None:
+            return cached
+        await self._check_dimension(collection_name, {len(query_vector)})
+        try:
+            response = await self._retry_async(
+                client.query_points,
+                collection_name,
+                query=query_vector,
+                limit=top_k,
+            )
+            results = response.points
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Search completed successfully in collection '%s'.",
+                    collection_name,
+                )
+        except Exception:
+            self.logger.error("Failed to search vectors", exc_info=True)
+            raise VectorSearchError(
+                "Failed to search vectors", "VECTOR_SEARCH_ERROR"
+            )
+        if key is not None:
+            self._cache_search_result(key, results)
+        return results
+
+    async def search_vectors_batch(
+        self,
+        collection_name: str,
+        query_vectors: VectorBatch,
+        top_k: int = 10,
+    ) -> List[Any]:
         """
-        results = self._client.search_vectors(
-            collection_name, query_vector, top_k
+        Searches for similar vectors for several queries in one request.
+
+        See :meth:`QdrantDBClient.search_vectors_batch`.
+        """
+        client = await self._ensure_connected()
+        await self._check_dimension(
+            collection_name, _dimensions(query_vectors)
         )
-        self.logger.info(
-            f"Search completed in collection '{collection_name}'."
+        try:
+            requests = self._query_requests(query_vectors, top_k)
+            responses = await self._retry_async(
+                client.query_batch_points,
+                collection_name=collection_name,
+                requests=requests,
+            )
+            self.logger.info(
+                "Batch search of %d queries completed successfully in "
+                "collection '%s'.",
+                len(requests),
+                collection_name,
+            )
+            return [response.points for response in responses]
+        except Exception:
+            self.logger.error("Failed to search vectors", exc_info=True)
+            raise VectorSearchError(
+                "Failed to search vectors", "VECTOR_SEARCH_ERROR"
+            )
+
+
+# === AsyncDBClient Wrapper ===
+
+
+class AsyncDBClient:
+    """
+    A unified asynchronous client for interacting with vector databases.
+
+    Offers the same interface as :class:`DBClient` with coroutine
+    methods. The per-vector operations are bound directly to the
+    backend's methods.
+
+    Parameters
+    ----------
+    backend : str
+        The backend to use (default: 'qdrant').
+    kwargs : dict
+        Additional parameters for backend initialization.
+    """
+
+    __slots__ = (
+        "_client",
+        "insert_vector",
+        "insert_vectors",
+        "search_vectors",
+        "search_vectors_batch",
+    )
+
+    def __init__(self, backend: str = "qdrant", **kwargs: Any) -> None:
+        if backend == "qdrant":
+            self._client = AsyncQdrantDBClient(**kwargs)
+        else:
+            raise DBClientException(
+                f"Backend '{backend}' is not supported",
+                "DB_UNSUPPORTED_BACKEND",
+            )
+        self.insert_vector = self._client.insert_vector
+        self.insert_vectors = self._client.insert_vectors
+        self.search_vectors = self._client.search_vectors
+        self.search_vectors_batch = self._client.search_vectors_batch
+
+    async def connect(self) -> None:
+        """Establishes a connection to the vector database."""
+        await self._client.connect()
+        self._client.logger.info("Connected to the vector database.")
+
+    async def create_collection(
+        self,
+        name: str,
+        vector_size: int,
+        distance_metric: str = "cosine",
+        **kwargs: Any,
+    ) -> None:
+        """
+        Creates a new collection in the vector database.
+
+        See :meth:`DBClient.create_collection`.
+        """
+        await self._client.create_collection(
+            name, vector_size, distance_metric, **kwargs
         )
-        return results
+        self._client.logger.info("Collection '%s' created.", name)
 
-    def __getattr__(self, name):
+    def __getattr__(self, name: str) -> Any:
         return getattr(self._client, name)
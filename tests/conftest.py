@@ -6,12 +6,18 @@ Contains pytest fixtures for setting up and tearing down
 resources used in testing the db_client module.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from darca_log_facility.logger import DarcaLogger
 
-from darca_vector_db import DBClient, QdrantDBClient
+from darca_vector_db import (
+    AsyncDBClient,
+    AsyncQdrantDBClient,
+    DBClient,
+    QdrantDBClient,
+)
+from darca_vector_db.db_client import _CLIENT_CACHE
 
 
 @pytest.fixture(scope="module")
@@ -41,7 +47,50 @@ def db_client(mock_logger):
     Fixture to create a generic DBClient instance for testing with
     mocked Qdrant backend.
     """
-    client = DBClient(backend="qdrant")
-    client._client = MagicMock()
-    client.logger = MagicMock()
+    with patch("darca_vector_db.db_client.QdrantDBClient"):
+        client = DBClient(backend="qdrant")
     return client
+
+
+@pytest.fixture
+def async_qdrant_client(mock_logger):
+    """
+    Fixture to create an AsyncQdrantDBClient instance for testing with
+    a mocked asynchronous Qdrant client.
+    """
+    client = AsyncQdrantDBClient(host="localhost", port=6333)
+    client.client = AsyncMock()  # Mock the actual AsyncQdrantClient
+    client.logger = MagicMock()  # Mock the logger
+    return client
+
+
+@pytest.fixture
+def async_db_client(mock_logger):
+    """
+    Fixture to create a generic AsyncDBClient instance for testing with
+    mocked Qdrant backend.
+    """
+    with patch("darca_vector_db.db_client.AsyncQdrantDBClient"):
+        client = AsyncDBClient(backend="qdrant")
+    client._client.connect = AsyncMock()
+    client._client.create_collection = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def client_cache():
+    """
+    Provides an empty shared Qdrant client cache for the duration of a test.
+    """
+    with patch.dict(_CLIENT_CACHE, clear=True):
+        yield _CLIENT_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_dimension_cache(request):
+    """
+    Forgets collection vector sizes cached on the shared qdrant_client by
+    earlier tests.
+    """
+    if "qdrant_client" in request.fixturenames:
+        request.getfixturevalue("qdrant_client").clear_dimension_cache()
@@ -5,19 +5,68 @@ test_db_client.py
 Tests for the db_client module ensuring 100% coverage.
 """
 
-from unittest.mock import MagicMock, patch
-
+import asyncio
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import grpc
+import httpx
+import numpy as np
 import pytest
 from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.http.models import (
+    BinaryQuantization,
+    Distance,
+    ScalarQuantization,
+    ScalarType,
+)
 
 from darca_vector_db import (
+    AsyncDBClient,
+    AsyncQdrantDBClient,
     BaseDBClient,
     CollectionCreationError,
+    CollectionUpdateError,
     DBClient,
+    DBClientException,
     DBConnectionError,
+    QdrantDBClient,
     VectorInsertionError,
     VectorSearchError,
 )
+from darca_vector_db.db_client import (
+    _get_shared_client,
+    _is_conflict,
+    _is_transient,
+    _SemanticCache,
+)
+
+
+class FakeRpcError(grpc.RpcError):
+    """
+    gRPC error carrying a status code, as raised by the gRPC transport.
+    """
+
+    def __init__(self, code: grpc.StatusCode):
+        super().__init__()
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+def unexpected_response(status_code: int) -> UnexpectedResponse:
+    """
+    Builds an UnexpectedResponse with the given HTTP status code.
+    """
+    return UnexpectedResponse(
+        reason_phrase="Error",
+        content=b"",
+        headers={},
+        status_code=status_code,
+    )
 
 
 class DummyDBClient(BaseDBClient):
@@ -43,11 +92,25 @@ class DummyDBClient(BaseDBClient):
     ) -> None:
         super().insert_vector(collection_name, vector_id, vector, metadata)
 
+    def insert_vectors(
+        self,
+        collection_name: str,
+        ids: list,
+        vectors: list,
+        payloads: list = None,
+    ) -> None:
+        super().insert_vectors(collection_name, ids, vectors, payloads)
+
     def search_vectors(
         self, collection_name: str, query_vector: list, top_k: int = 10
     ) -> None:
         super().search_vectors(collection_name, query_vector, top_k)
 
+    def search_vectors_batch(
+        self, collection_name: str, query_vectors: list, top_k: int = 10
+    ) -> None:
+        super().search_vectors_batch(collection_name, query_vectors, top_k)
+
 
 def test_base_dbclient_connect():
     """
@@ -88,6 +151,21 @@ def test_base_dbclient_insert_vector():
         )
 
 
+def test_base_dbclient_insert_vectors():
+    """
+    Test that BaseDBClient.insert_vectors() raises NotImplementedError.
+    """
+    client = DummyDBClient()
+    with pytest.raises(
+        NotImplementedError, match="Subclasses must implement this method."
+    ):
+        client.insert_vectors(
+            collection_name="test_collection",
+            ids=["vec1"],
+            vectors=[[0.1, 0.2, 0.3]],
+        )
+
+
 def test_base_dbclient_search_vectors():
     """
     Test that BaseDBClient.search_vectors() raises NotImplementedError.
@@ -101,6 +179,19 @@ def test_base_dbclient_search_vectors():
         )
 
 
+def test_base_dbclient_search_vectors_batch():
+    """
+    Test that BaseDBClient.search_vectors_batch() raises NotImplementedError.
+    """
+    client = DummyDBClient()
+    with pytest.raises(
+        NotImplementedError, match="Subclasses must implement this method."
+    ):
+        client.search_vectors_batch(
+            collection_name="test_collection", query_vectors=[[0.1, 0.2]]
+        )
+
+
 def test_dbclient_initialization(db_client):
     """
     Test the initialization of the DBClient with a Qdrant backend.
@@ -108,22 +199,44 @@ def test_dbclient_initialization(db_client):
     assert isinstance(db_client._client, MagicMock)
 
 
-def test_qdrant_connect(qdrant_client):
+def test_qdrant_connect(qdrant_client, client_cache):
     """
     Test successful connection to the Qdrant server.
     """
-    with patch.object(qdrant_client, "client", MagicMock()):
+    qdrant_client.logger.reset_mock()
+    with patch.object(qdrant_client, "client", None), patch(
+        "darca_vector_db.db_client.QdrantClient"
+    ):
         qdrant_client.connect()
         qdrant_client.logger.info.assert_called_once_with(
-            "Successfully connected to Qdrant at localhost:6333"
+            "Successfully connected to Qdrant at %s:%s", "localhost", 6333
         )
 
 
-def test_qdrant_connect_failure(qdrant_client):
+def test_qdrant_connect_prefers_grpc(qdrant_client, client_cache):
+    """
+    Test that the Qdrant client is constructed for the gRPC transport.
+    """
+    with patch.object(qdrant_client, "client", None), patch(
+        "darca_vector_db.db_client.QdrantClient"
+    ) as mock_cls:
+        qdrant_client.connect()
+
+    mock_cls.assert_called_once_with(
+        host="localhost",
+        port=6333,
+        grpc_port=6334,
+        prefer_grpc=True,
+        api_key=None,
+    )
+
+
+def test_qdrant_connect_failure(qdrant_client, client_cache):
     """
     Test connection failure handling in QdrantDBClient.
     """
-    with patch(
+    qdrant_client.logger.reset_mock()
+    with patch.object(qdrant_client, "client", None), patch(
         "darca_vector_db.db_client.QdrantClient",
         side_effect=Exception("Connection Failed"),
     ):
@@ -136,6 +249,77 @@ def test_qdrant_connect_failure(qdrant_client):
     )
 
 
+def test_qdrant_connect_shares_client(mock_logger, client_cache):
+    """
+    Test that instances with the same settings share one Qdrant client.
+    """
+    first = QdrantDBClient(host="localhost", port=6333)
+    second = QdrantDBClient(host="localhost", port=6333)
+
+    with patch("darca_vector_db.db_client.QdrantClient") as mock_cls:
+        first.connect()
+        second.connect()
+
+    mock_cls.assert_called_once()
+    assert first.client is second.client
+
+    first.close()
+    assert first.client is None
+    mock_cls.return_value.close.assert_not_called()
+
+    second.close()
+    mock_cls.return_value.close.assert_called_once()
+    assert client_cache == {}
+
+
+def test_qdrant_connect_is_idempotent(mock_logger, client_cache):
+    """
+    Test that connecting twice reuses the existing connection.
+    """
+    client = QdrantDBClient(host="localhost", port=6333)
+
+    with patch("darca_vector_db.db_client.QdrantClient") as mock_cls:
+        client.connect()
+        client.connect()
+
+    mock_cls.assert_called_once()
+    assert [refcount for _, refcount in client_cache.values()] == [1]
+    client.close()
+    assert client_cache == {}
+
+
+def test_qdrant_close_after_cache_reset(mock_logger, client_cache):
+    """
+    Test that closing a client whose shared entry is gone is a no-op.
+    """
+    client = QdrantDBClient(host="localhost", port=6333)
+
+    with patch("darca_vector_db.db_client.QdrantClient") as mock_cls:
+        client.connect()
+    client_cache.clear()
+    client.close()
+
+    mock_cls.return_value.close.assert_not_called()
+    assert client.client is None
+
+
+def test_qdrant_connects_lazily(mock_logger, client_cache):
+    """
+    Test that the first operation connects an unconnected client.
+    """
+    client = QdrantDBClient(host="localhost", port=6333)
+
+    with patch("darca_vector_db.db_client.QdrantClient") as mock_cls:
+        mock_cls.return_value.get_collection.side_effect = Exception
+        mock_cls.return_value.query_points.return_value.points = []
+        results = client.search_vectors("test_collection", [0.1, 0.2])
+
+    mock_cls.assert_called_once()
+    assert client.client is mock_cls.return_value
+    assert results == []
+    client.close()
+
+
 def test_create_collection_success(qdrant_client):
     """
     Test successful collection creation.
@@ -144,199 +328,1680 @@ def test_create_collection_success(qdrant_client):
     qdrant_client.client.create_collection.return_value = None
     qdrant_client.create_collection("test_collection", 128, "cosine")
     qdrant_client.logger.info.assert_called_once_with(
-        "Collection 'test_collection' created successfully."
+        "Collection '%s' created successfully.", "test_collection"
     )
 
 
-def test_insert_vector_success(qdrant_client):
+def test_create_collection_bulk_load(qdrant_client):
     """
-    Test successful vector insertion.
+    Test that bulk_load disables HNSW and indexing at creation time.
     """
-    qdrant_client.logger.info.reset_mock()  # Ensure isolation between tests
-    qdrant_client.client.upsert.return_value = None
-    qdrant_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
-    qdrant_client.logger.info.assert_called_once_with(
-        "Vector with ID 'vec1' inserted successfully into 'test_collection'."
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = None
+
+    qdrant_client.create_collection(
+        "test_collection", 128, "cosine", bulk_load=True
     )
 
+    kwargs = qdrant_client.client.create_collection.call_args.kwargs
+    assert kwargs["hnsw_config"].m == 0
+    assert kwargs["optimizers_config"].indexing_threshold == 0
 
-def test_insert_vector_failure(qdrant_client):
+
+def test_create_collection_indexing_threshold(qdrant_client):
     """
-    Test vector insertion failure handling.
+    Test that an explicit indexing_threshold is passed without touching HNSW.
     """
-    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = None
 
-    qdrant_client.client.upsert.side_effect = Exception("Insertion Failed")
+    qdrant_client.create_collection(
+        "test_collection", 128, "cosine", indexing_threshold=5000
+    )
 
-    with pytest.raises(VectorInsertionError):
-        qdrant_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
+    kwargs = qdrant_client.client.create_collection.call_args.kwargs
+    assert kwargs["hnsw_config"] is None
+    assert kwargs["optimizers_config"].indexing_threshold == 5000
+    assert kwargs["quantization_config"] is None
 
-    qdrant_client.logger.error.assert_called_once()
 
+def test_create_collection_int8_quantization(qdrant_client):
+    """
+    Test that int8 quantization configures scalar quantization in RAM.
+    """
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = None
 
-def test_search_vectors_success(qdrant_client):
+    qdrant_client.create_collection(
+        "test_collection", 128, "cosine", quantization="int8"
+    )
+
+    kwargs = qdrant_client.client.create_collection.call_args.kwargs
+    config = kwargs["quantization_config"]
+    assert isinstance(config, ScalarQuantization)
+    assert config.scalar.type == ScalarType.INT8
+    assert config.scalar.quantile == 0.99
+    assert config.scalar.always_ram is True
+
+
+def test_create_collection_binary_quantization(qdrant_client):
     """
-    Test successful vector search operation.
+    Test that binary quantization is passed on to Qdrant.
+    """
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = None
+
+    qdrant_client.create_collection(
+        "test_collection", 128, "cosine", quantization="BINARY"
+    )
+
+    kwargs = qdrant_client.client.create_collection.call_args.kwargs
+    assert isinstance(kwargs["quantization_config"], BinaryQuantization)
+
+
+def test_create_collection_invalid_quantization(qdrant_client):
+    """
+    Test that an unknown quantization is rejected before any request.
+    """
+    qdrant_client.client.create_collection.reset_mock()
+
+    with pytest.raises(ValueError, match="Unsupported quantization: int4"):
+        qdrant_client.create_collection(
+            "test_collection", 128, "cosine", quantization="int4"
+        )
+
+    qdrant_client.client.create_collection.assert_not_called()
+
+
+def test_finalize_index_success(qdrant_client):
+    """
+    Test that finalize_index restores HNSW and indexing settings.
     """
     qdrant_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.update_collection.side_effect = None
 
-    qdrant_client.client.search.return_value = ["result1", "result2"]
-    results = qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+    qdrant_client.finalize_index("test_collection")
 
-    assert results == ["result1", "result2"]
+    args = qdrant_client.client.update_collection.call_args
+    assert args.args == ("test_collection",)
+    assert args.kwargs["hnsw_config"].m == 16
+    assert args.kwargs["optimizers_config"].indexing_threshold == 20000
     qdrant_client.logger.info.assert_called_once_with(
-        "Search completed successfully in collection 'test_collection'."
+        "Index for collection '%s' finalized.", "test_collection"
     )
 
 
-def test_search_vectors_failure(qdrant_client):
+def test_finalize_index_failure(qdrant_client):
     """
-    Test vector search failure handling.
+    Test finalize_index failure handling.
     """
     qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.update_collection.side_effect = Exception("Failed")
 
-    qdrant_client.client.search.side_effect = Exception("Search Failed")
+    with pytest.raises(CollectionUpdateError):
+        qdrant_client.finalize_index("test_collection")
 
-    with pytest.raises(VectorSearchError):
-        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
-
-    qdrant_client.logger.error.assert_called_once()
+    qdrant_client.logger.error.assert_called_once_with(
+        "Failed to finalize index", exc_info=True
+    )
+    qdrant_client.client.update_collection.side_effect = None
 
 
-def test_dbclient_backend_error():
+def test_insert_vector_success(qdrant_client):
     """
-    Test unsupported backend initialization in DBClient.
+    Test successful vector insertion.
     """
-    with pytest.raises(Exception):
-        DBClient(backend="invalid_backend")
+    qdrant_client.logger.debug.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upsert.return_value = None
+    qdrant_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
+    qdrant_client.logger.debug.assert_called_once_with(
+        "Vector with ID '%s' inserted successfully into '%s'.",
+        "vec1",
+        "test_collection",
+    )
 
 
-def test_create_collection_invalid_distance_metric(qdrant_client):
+def test_insert_vector_debug_disabled(qdrant_client):
     """
-    Test collection creation failure due to invalid distance metric.
-    This will cover line 143 where a ValueError is raised due to
-    AttributeError.
+    Test that the per-vector log call is skipped when DEBUG is disabled.
     """
-    with pytest.raises(
-        ValueError, match="Unsupported distance metric: INVALID_METRIC"
+    qdrant_client.logger.debug.reset_mock()  # Ensure isolation between tests
+
+    with patch.object(
+        qdrant_client.logger, "isEnabledFor", return_value=False
     ):
-        qdrant_client.create_collection(
-            "test_collection", 128, "INVALID_METRIC"
-        )
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
 
+    qdrant_client.logger.debug.assert_not_called()
 
-def test_create_collection_unexpected_response(qdrant_client):
+
+def test_insert_vector_wait(qdrant_client):
     """
-    Test collection creation failure due to an UnexpectedResponse exception.
-    This will cover lines 145 and 146 where logger.error is called
-    and CollectionCreationError is raised.
+    Test that insert_vector does not wait for indexing unless asked to.
     """
-    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = None
 
-    # Mock the client to raise an UnexpectedResponse with required arguments
-    qdrant_client.client.create_collection.side_effect = UnexpectedResponse(
-        reason_phrase="Bad Request",
-        content="Error occurred while creating collection",
-        headers={"Content-Type": "application/json"},
-        status_code=400,
+    qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
+    assert qdrant_client.client.upsert.call_args.kwargs["wait"] is False
+
+    qdrant_client.insert_vector(
+        "test_collection", 1, [0.1, 0.2, 0.3], wait=True
     )
+    assert qdrant_client.client.upsert.call_args.kwargs["wait"] is True
 
-    with pytest.raises(
-        CollectionCreationError, match="Failed to create collection"
+
+def test_insert_vector_ndarray(qdrant_client):
+    """
+    Test that NumPy vectors are accepted and converted to float32 once.
+    """
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = None
+
+    vector = np.array([0.1, 0.2, 0.3], dtype=np.float64)
+    qdrant_client.insert_vector("test_collection", 1, vector)
+
+    point = qdrant_client.client.upsert.call_args.kwargs["points"][0]
+    assert point.vector == np.float32([0.1, 0.2, 0.3]).tolist()
+
+
+def test_insert_vector_dimension_mismatch(qdrant_client):
+    """
+    Test that vectors of the wrong size are rejected without a request.
+    """
+    qdrant_client.client.create_collection.side_effect = None
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.create_collection("test_collection", 4, "cosine")
+
+    with pytest.raises(ValueError, match="does not match the dimension 4"):
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
+
+    qdrant_client.client.upsert.assert_not_called()
+
+
+def test_insert_vector_dimension_fetched_once(qdrant_client):
+    """
+    Test that an unknown collection size is fetched once and then cached.
+    """
+    qdrant_client.client.upsert.side_effect = None
+
+    with patch.object(qdrant_client.client, "get_collection") as get:
+        get.return_value.config.params.vectors.size = 3
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
+        with pytest.raises(ValueError):
+            qdrant_client.insert_vector("test_collection", 2, [0.1, 0.2])
+
+    get.assert_called_once_with("test_collection")
+
+
+def test_insert_vector_dimension_unknown(qdrant_client):
+    """
+    Test that validation is skipped when the size cannot be fetched.
+    """
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = None
+
+    with patch.object(
+        qdrant_client.client,
+        "get_collection",
+        side_effect=Exception("Failed"),
     ):
-        qdrant_client.create_collection("test_collection", 128, "cosine")
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
 
-    # Ensure the logger.error call is made
-    qdrant_client.logger.error.assert_called_once_with(
-        "Failed to create collection", exc_info=True
-    )
+    qdrant_client.client.upsert.assert_called_once()
 
 
-def test_dbclient_connect(db_client):
+def test_insert_vector_dimension_unknown_cached(qdrant_client):
     """
-    Test the connect() method of DBClient.
-    Ensures that the connection is made and the logger.info() is called.
+    Test that an undeterminable size is looked up once per collection.
     """
-    db_client._client.connect = MagicMock()
+    qdrant_client.client.upsert.side_effect = None
 
-    db_client.connect()
+    with patch.object(qdrant_client.client, "get_collection") as get:
+        get.return_value.config.params.vectors = {"named": MagicMock()}
+        for vector_id in range(3):
+            qdrant_client.insert_vector(
+                "test_collection", vector_id, [0.1, 0.2, 0.3]
+            )
+        get.assert_called_once_with("test_collection")
 
-    db_client._client.connect.assert_called_once()
-    db_client.logger.info.assert_called_once_with(
-        "Connected to the vector database."
-    )
+        qdrant_client.clear_dimension_cache("test_collection")
+        qdrant_client.insert_vector("test_collection", 3, [0.1, 0.2, 0.3])
 
+    assert get.call_count == 2
 
-def test_dbclient_create_collection(db_client):
+
+def test_insert_vector_dimension_not_found_cached(qdrant_client):
     """
-    Test the create_collection() method of DBClient.
-    Ensures that the collection creation is made and the logger.info()
-    is called.
+    Test that a missing collection is remembered as having no known size.
     """
-    db_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upsert.side_effect = None
 
-    db_client._client.create_collection = MagicMock()
+    with patch.object(
+        qdrant_client.client,
+        "get_collection",
+        side_effect=unexpected_response(404),
+    ) as get:
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
+        qdrant_client.insert_vector("test_collection", 2, [0.1, 0.2])
 
-    db_client.create_collection("test_collection", 128, "cosine")
+    get.assert_called_once_with("test_collection")
+    assert qdrant_client._dim_cache == {"test_collection": None}
 
-    db_client._client.create_collection.assert_called_once_with(
-        "test_collection", 128, "cosine"
-    )
-    db_client.logger.info.assert_called_once_with(
-        "Collection 'test_collection' created."
-    )
 
+def test_insert_vector_dimension_transient_error_not_cached(qdrant_client):
+    """
+    Test that a failed size lookup is retried on the next call.
+    """
+    qdrant_client.client.upsert.side_effect = None
+    info = MagicMock()
+    info.config.params.vectors.size = 3
 
-def test_dbclient_insert_vector(db_client):
+    with patch.object(
+        qdrant_client.client,
+        "get_collection",
+        side_effect=[httpx.ReadTimeout("timed out"), info],
+    ) as get:
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2])
+        with pytest.raises(ValueError):
+            qdrant_client.insert_vector("test_collection", 2, [0.1, 0.2])
+
+    assert get.call_count == 2
+    assert qdrant_client._dim_cache == {"test_collection": 3}
+
+
+def test_clear_dimension_cache(qdrant_client):
     """
-    Test the insert_vector() method of DBClient.
-    Ensures that the vector insertion is made and the logger.info()
-    is called.
+    Test that a cached size is dropped, so that a collection recreated
+    elsewhere with another size is validated against its new size.
     """
-    db_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upsert.side_effect = None
+    qdrant_client._dim_cache.update({"test_collection": 4, "other": 2})
 
-    db_client._client.insert_vector = MagicMock()
+    with patch.object(qdrant_client.client, "get_collection") as get:
+        get.return_value.config.params.vectors.size = 8
+        qdrant_client.clear_dimension_cache("test_collection")
+        assert qdrant_client._dim_cache == {"other": 2}
+        qdrant_client.insert_vector("test_collection", 1, [0.0] * 8)
 
-    db_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
+    get.assert_called_once_with("test_collection")
+    qdrant_client.clear_dimension_cache()
+    assert qdrant_client._dim_cache == {}
 
-    db_client._client.insert_vector.assert_called_once_with(
-        "test_collection", "vec1", [0.1, 0.2, 0.3], None
-    )
-    db_client.logger.info.assert_called_once_with(
-        "Vector 'vec1' inserted into collection 'test_collection'."
-    )
 
+def test_search_vectors_cache_hit_skips_dimension_lookup(qdrant_client):
+    """
+    Test that cache hits are served without fetching the collection size.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.side_effect = None
 
-def test_dbclient_search_vectors(db_client):
+    with patch.object(qdrant_client, "search_cache_size", 8):
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+        qdrant_client._dim_cache.clear()
+        with patch.object(qdrant_client.client, "get_collection") as get:
+            qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    get.assert_not_called()
+    qdrant_client.clear_search_cache()
+
+
+def test_insert_vector_failure(qdrant_client):
     """
-    Test the search_vectors() method of DBClient.
-    Ensures that the search operation is made and the logger.info() is called.
+    Test vector insertion failure handling.
     """
-    db_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
 
-    db_client._client.search_vectors = MagicMock(
-        return_value=["result1", "result2"]
-    )
+    qdrant_client.client.upsert.side_effect = Exception("Insertion Failed")
 
-    results = db_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+    with pytest.raises(VectorInsertionError):
+        qdrant_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
 
-    db_client._client.search_vectors.assert_called_once_with(
-        "test_collection", [0.1, 0.2, 0.3], 10
+    qdrant_client.logger.error.assert_called_once()
+
+
+def test_insert_vectors_success(qdrant_client):
+    """
+    Test that bulk insertion is split into batched upsert calls.
+    """
+    qdrant_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = None
+
+    ids = list(range(5))
+    vectors = [[0.1, 0.2, 0.3]] * 5
+    payloads = [{"n": i} for i in ids]
+    qdrant_client.insert_vectors(
+        "test_collection", ids, vectors, payloads, batch_size=2
     )
-    db_client.logger.info.assert_called_once_with(
-        "Search completed in collection 'test_collection'."
+
+    calls = qdrant_client.client.upsert.call_args_list
+    assert [c.kwargs["points"].ids for c in calls] == [[0, 1], [2, 3], [4]]
+    assert all(c.kwargs["wait"] is False for c in calls)
+    assert calls[2].kwargs["points"].payloads == [{"n": 4}]
+    qdrant_client.logger.info.assert_called_once_with(
+        "%d vectors inserted successfully into '%s'.", 5, "test_collection"
     )
-    assert results == ["result1", "result2"]
 
 
-def test_dbclient_getattr(db_client):
+def test_insert_vectors_ndarray(qdrant_client):
     """
-    Test the __getattr__() method of DBClient.
-    Ensures that method calls are delegated to the backend client.
+    Test that a 2-D NumPy array is accepted for bulk insertion.
     """
-    db_client._client.some_method = MagicMock(return_value="delegated")
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = None
 
-    result = db_client.some_method()
+    vectors = np.arange(6, dtype=np.float32).reshape(3, 2)
+    qdrant_client.insert_vectors("test_collection", [1, 2, 3], vectors)
 
-    assert result == "delegated"
-    db_client._client.some_method.assert_called_once()
+    batch = qdrant_client.client.upsert.call_args.kwargs["points"]
+    assert batch.vectors == vectors.tolist()
+    assert batch.payloads is None
+
+
+def test_insert_vectors_length_mismatch(qdrant_client):
+    """
+    Test that mismatched ids and vectors are rejected before upserting.
+    """
+    qdrant_client.client.upsert.reset_mock()
+
+    with pytest.raises(ValueError, match="must have the same length"):
+        qdrant_client.insert_vectors(
+            "test_collection", [1, 2], [[0.1, 0.2, 0.3]]
+        )
+    with pytest.raises(ValueError, match="must have the same length"):
+        qdrant_client.insert_vectors(
+            "test_collection", [1], [[0.1, 0.2, 0.3]], [{}, {}]
+        )
+
+    qdrant_client.client.upsert.assert_not_called()
+
+
+def test_insert_vectors_invalid_points(qdrant_client):
+    """
+    Test that points rejected by the client models raise
+    VectorInsertionError.
+    """
+    qdrant_client.client.upsert.reset_mock()
+
+    with pytest.raises(VectorInsertionError):
+        qdrant_client.insert_vectors("test_collection", [1.5], [[0.1, 0.2]])
+    with pytest.raises(VectorInsertionError):
+        qdrant_client.insert_vectors(
+            "test_collection", [1, 2], np.float32([0.1, 0.2])
+        )
+
+    qdrant_client.client.upsert.assert_not_called()
+
+
+def test_insert_vectors_dimension_mismatch(qdrant_client):
+    """
+    Test that a batch containing a wrongly sized vector is rejected.
+    """
+    qdrant_client.client.create_collection.side_effect = None
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.create_collection("test_collection", 2, "cosine")
+
+    with pytest.raises(ValueError, match="Vector dimension 3"):
+        qdrant_client.insert_vectors(
+            "test_collection", [1, 2], [[0.1, 0.2], [0.1, 0.2, 0.3]]
+        )
+    with pytest.raises(ValueError, match="Vector dimension 3"):
+        qdrant_client.insert_vectors(
+            "test_collection", [1], np.zeros((1, 3), dtype=np.float32)
+        )
+
+    qdrant_client.client.upsert.assert_not_called()
+
+
+def test_insert_vectors_failure(qdrant_client):
+    """
+    Test bulk insertion failure handling.
+    """
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+
+    qdrant_client.client.upsert.side_effect = Exception("Insertion Failed")
+
+    with pytest.raises(VectorInsertionError):
+        qdrant_client.insert_vectors("test_collection", [1], [[0.1, 0.2]])
+
+    qdrant_client.logger.error.assert_called_once()
+    qdrant_client.client.upsert.side_effect = None
+
+
+def test_upload_stream_success(qdrant_client):
+    """
+    Test that streamed points are handed lazily to upload_points.
+    """
+    qdrant_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upload_points.side_effect = None
+
+    stream = ((i, np.float32([i, i]), {"n": i}) for i in range(3))
+    qdrant_client.upload_stream("test_collection", stream, parallel=2)
+
+    kwargs = qdrant_client.client.upload_points.call_args.kwargs
+    assert kwargs["batch_size"] == 256
+    assert kwargs["parallel"] == 2
+    assert kwargs["wait"] is False
+    points = list(kwargs["points"])
+    assert [p.id for p in points] == [0, 1, 2]
+    assert points[2].vector == [2.0, 2.0]
+    assert points[2].payload == {"n": 2}
+    qdrant_client.logger.info.assert_called_once_with(
+        "Upload stream completed successfully into '%s'.", "test_collection"
+    )
+
+
+def test_upload_stream_default_parallel(qdrant_client):
+    """
+    Test that upload_stream uses one worker per CPU by default.
+    """
+    qdrant_client.client.upload_points.side_effect = None
+
+    with patch("darca_vector_db.db_client.os.cpu_count", return_value=4):
+        qdrant_client.upload_stream("test_collection", [])
+
+    kwargs = qdrant_client.client.upload_points.call_args.kwargs
+    assert kwargs["parallel"] == 4
+
+
+def test_upload_stream_failure(qdrant_client):
+    """
+    Test upload stream failure handling.
+    """
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.upload_points.side_effect = Exception("Failed")
+
+    with pytest.raises(VectorInsertionError):
+        qdrant_client.upload_stream("test_collection", [])
+
+    qdrant_client.logger.error.assert_called_once_with(
+        "Failed to upload vectors", exc_info=True
+    )
+    qdrant_client.client.upload_points.side_effect = None
+
+
+def test_search_vectors_success(qdrant_client):
+    """
+    Test successful vector search operation.
+    """
+    qdrant_client.logger.debug.reset_mock()  # Ensure isolation between tests
+    qdrant_client.clear_search_cache()
+
+    qdrant_client.client.query_points.return_value.points = [
+        "result1",
+        "result2",
+    ]
+    results = qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    assert results == ["result1", "result2"]
+    qdrant_client.logger.debug.assert_called_once_with(
+        "Search completed successfully in collection '%s'.", "test_collection"
+    )
+
+
+def test_search_vectors_ndarray(qdrant_client):
+    """
+    Test that NumPy query vectors are passed on as float32 arrays.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.side_effect = None
+
+    qdrant_client.search_vectors(
+        "test_collection", np.array([0.1, 0.2, 0.3], dtype=np.float64)
+    )
+
+    query = qdrant_client.client.query_points.call_args.kwargs["query"]
+    assert isinstance(query, np.ndarray)
+    assert query.dtype == np.float32
+    assert query.flags["C_CONTIGUOUS"]
+
+
+def test_search_vectors_list_converted_once(qdrant_client):
+    """
+    Test that list query vectors are converted to a float32 array.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.side_effect = None
+
+    qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    query = qdrant_client.client.query_points.call_args.kwargs["query"]
+    assert isinstance(query, np.ndarray)
+    assert query.dtype == np.float32
+    np.testing.assert_allclose(query, [0.1, 0.2, 0.3], rtol=1e-6)
+
+
+def test_search_vectors_cache_hit(qdrant_client):
+    """
+    Test that repeated queries are answered from the LRU cache.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = [{"id": 1}]
+
+    with patch.object(qdrant_client, "search_cache_size", 8):
+        first = qdrant_client.search_vectors(
+            "test_collection", [0.1, 0.2, 0.3]
+        )
+        first[0]["id"] = 2  # Mutating a result must not affect the cache
+        second = qdrant_client.search_vectors(
+            "test_collection", np.float32([0.1, 0.2, 0.3])
+        )
+
+    assert second == [{"id": 1}]
+    qdrant_client.client.query_points.assert_called_once()
+
+
+def test_search_vectors_cache_invalidated_on_insert(qdrant_client):
+    """
+    Test that inserting into a collection drops its cached results only.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.upsert.side_effect = None
+    qdrant_client.client.query_points.return_value.points = ["result"]
+
+    with patch.object(qdrant_client, "search_cache_size", 8):
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+        qdrant_client.search_vectors("other_collection", [0.1, 0.2, 0.3])
+        qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2, 0.3])
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+        qdrant_client.search_vectors("other_collection", [0.1, 0.2, 0.3])
+
+    assert qdrant_client.client.query_points.call_count == 3
+
+
+def test_search_vectors_cache_eviction(qdrant_client):
+    """
+    Test that the least recently used entry is evicted when full.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = ["result"]
+
+    with patch.object(qdrant_client, "search_cache_size", 2):
+        qdrant_client.search_vectors("test_collection", [1.0])
+        qdrant_client.search_vectors("test_collection", [2.0])
+        qdrant_client.search_vectors("test_collection", [1.0])
+        qdrant_client.search_vectors("test_collection", [3.0])
+        qdrant_client.search_vectors("test_collection", [1.0])
+        qdrant_client.search_vectors("test_collection", [2.0])
+
+    assert qdrant_client.client.query_points.call_count == 4
+
+
+def test_search_vectors_cache_disabled(qdrant_client):
+    """
+    Test that the search cache is disabled by default.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = ["result"]
+
+    assert qdrant_client.search_cache_size == 0
+    qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+    qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    assert qdrant_client.client.query_points.call_count == 2
+
+
+def test_search_vectors_in_flight_result_not_cached(qdrant_client):
+    """
+    Test that results of a search overlapping an invalidation are dropped.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+
+    def search_during_insert(*args, **kwargs):
+        qdrant_client.clear_search_cache("test_collection")
+        return MagicMock(points=["stale"])
+
+    qdrant_client.client.query_points.side_effect = search_during_insert
+    with patch.object(qdrant_client, "search_cache_size", 8):
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+        qdrant_client.client.query_points.side_effect = None
+        qdrant_client.client.query_points.return_value.points = ["fresh"]
+        results = qdrant_client.search_vectors(
+            "test_collection", [0.1, 0.2, 0.3]
+        )
+
+    assert results == ["fresh"]
+    assert qdrant_client.client.query_points.call_count == 2
+
+
+def test_search_cache_concurrent_access(qdrant_client):
+    """
+    Test that concurrent searches and invalidations do not corrupt the cache.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = ["result"]
+
+    def worker(n):
+        for i in range(200):
+            qdrant_client.search_vectors("test_collection", [float(i % 5)])
+            if i % 7 == n:
+                qdrant_client.clear_search_cache("test_collection")
+
+    with patch.object(qdrant_client, "search_cache_size", 3):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(worker, range(4)))
+
+        assert len(qdrant_client._search_cache) <= 3
+    qdrant_client.clear_search_cache()
+
+
+def test_qdrant_concurrent_connect(mock_logger, client_cache):
+    """
+    Test that concurrent first calls acquire the shared client only once.
+    """
+    client = QdrantDBClient(host="localhost", port=6333)
+
+    def slow_get_shared_client(*args):
+        time.sleep(0.01)  # Widen the window between check and acquisition
+        return _get_shared_client(*args)
+
+    with patch("darca_vector_db.db_client.QdrantClient") as mock_cls, patch(
+        "darca_vector_db.db_client._get_shared_client",
+        side_effect=slow_get_shared_client,
+    ):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: client._ensure_connected(), range(4)))
+
+    assert [refcount for _, refcount in client_cache.values()] == [1]
+    client.close()
+    mock_cls.return_value.close.assert_called_once()
+    assert client_cache == {}
+
+
+def test_search_vectors_semantic_cache_hit(qdrant_client):
+    """
+    Test that a similar query is answered from the semantic cache.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.logger.debug.reset_mock()
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = ["result"]
+
+    with patch.object(qdrant_client, "search_cache_size", 0), patch.object(
+        qdrant_client, "semantic_cache_size", 4
+    ):
+        qdrant_client.search_vectors("test_collection", [1.0, 0.0, 0.0])
+        similar = qdrant_client.search_vectors(
+            "test_collection", [0.9, 0.1, 0.0]
+        )
+        qdrant_client.search_vectors("test_collection", [0.0, 1.0, 0.0])
+        qdrant_client.search_vectors(
+            "test_collection", [1.0, 0.0, 0.0], top_k=5
+        )
+
+    assert similar == ["result"]
+    assert qdrant_client.client.query_points.call_count == 3
+    qdrant_client.logger.debug.assert_any_call(
+        "Search served from %s for collection '%s'.",
+        "semantic cache",
+        "test_collection",
+    )
+    qdrant_client.clear_search_cache()
+
+
+def test_search_vectors_caches_share_one_copy(qdrant_client):
+    """
+    Test that a miss copies the results once for both caches.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.side_effect = None
+    qdrant_client.client.query_points.return_value.points = [{"id": 1}]
+
+    with patch.object(qdrant_client, "search_cache_size", 4), patch.object(
+        qdrant_client, "semantic_cache_size", 4
+    ), patch(
+        "darca_vector_db.db_client.copy.deepcopy", wraps=copy.deepcopy
+    ) as mock_deepcopy:
+        qdrant_client.search_vectors("test_collection", [1.0, 0.0, 0.0])
+
+    mock_deepcopy.assert_called_once()
+    qdrant_client.clear_search_cache()
+
+
+def test_search_vectors_semantic_cache_invalidated(qdrant_client):
+    """
+    Test that clearing a collection also drops its semantic cache.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = None
+
+    with patch.object(qdrant_client, "semantic_cache_size", 4):
+        qdrant_client.search_vectors("test_collection", [1.0, 0.0, 0.0])
+        qdrant_client.clear_search_cache("test_collection")
+        qdrant_client.search_vectors("test_collection", [0.9, 0.1, 0.0])
+
+    assert qdrant_client.client.query_points.call_count == 2
+    qdrant_client.clear_search_cache()
+
+
+def test_semantic_cache_threshold_and_eviction():
+    """
+    Test the similarity threshold and LRU eviction of the semantic cache.
+    """
+    cache = _SemanticCache(size=2, threshold=0.86)
+    x, y, z = np.eye(3, dtype=np.float32)
+
+    assert cache.get(x) is None
+    cache.put(x, "x")
+    cache.put(y, "y")
+    assert cache.get(np.float32([2.0, 0.2, 0.0])) == "x"
+    assert cache.get(np.float32([1.0, 1.0, 0.0])) is None  # cos = 0.71
+
+    cache.put(z, "z")  # Evicts y, the least recently used entry
+    assert cache.get(y) is None
+    assert cache.get(x) == "x"
+    assert cache.get(z) == "z"
+
+
+def test_semantic_cache_skips_incomparable_queries():
+    """
+    Test that zero vectors and other dimensions bypass the semantic cache.
+    """
+    cache = _SemanticCache(size=2, threshold=0.86)
+    cache.put(np.zeros(3, dtype=np.float32), "zero")
+    cache.put(np.float32([1.0, 0.0, 0.0]), "x")
+
+    assert cache.get(np.zeros(3, dtype=np.float32)) is None
+    assert cache.get(np.float32([1.0, 0.0])) is None
+    assert cache.get(np.float32([1.0, 0.0, 0.0])) == "x"
+
+
+def test_search_vectors_dimension_mismatch(qdrant_client):
+    """
+    Test that query vectors of the wrong size are rejected locally.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.create_collection.side_effect = None
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_batch_points.reset_mock()
+    qdrant_client.create_collection("test_collection", 2, "cosine")
+
+    with pytest.raises(ValueError):
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+    with pytest.raises(ValueError):
+        qdrant_client.search_vectors_batch(
+            "test_collection", np.zeros((2, 3), dtype=np.float32)
+        )
+
+    qdrant_client.client.query_points.assert_not_called()
+    qdrant_client.client.query_batch_points.assert_not_called()
+
+
+def test_search_vectors_failure(qdrant_client):
+    """
+    Test vector search failure handling.
+    """
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.clear_search_cache()
+
+    qdrant_client.client.query_points.side_effect = Exception("Search Failed")
+
+    with pytest.raises(VectorSearchError):
+        qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    qdrant_client.logger.error.assert_called_once()
+
+
+def test_search_vectors_batch_success(qdrant_client):
+    """
+    Test that several queries are sent in a single batch request.
+    """
+    qdrant_client.logger.info.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.query_batch_points.side_effect = None
+    qdrant_client.client.query_batch_points.return_value = [
+        MagicMock(points=["a"]),
+        MagicMock(points=["b"]),
+    ]
+
+    results = qdrant_client.search_vectors_batch(
+        "test_collection", np.array([[0.1, 0.2], [0.3, 0.4]]), top_k=5
+    )
+
+    assert results == [["a"], ["b"]]
+    kwargs = qdrant_client.client.query_batch_points.call_args.kwargs
+    assert kwargs["collection_name"] == "test_collection"
+    assert [r.query for r in kwargs["requests"]] == (
+        np.float32([[0.1, 0.2], [0.3, 0.4]]).tolist()
+    )
+    assert all(r.limit == 5 for r in kwargs["requests"])
+    qdrant_client.logger.info.assert_called_once_with(
+        "Batch search of %d queries completed successfully in "
+        "collection '%s'.",
+        2,
+        "test_collection",
+    )
+
+
+def test_search_vectors_batch_failure(qdrant_client):
+    """
+    Test batch search failure handling.
+    """
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+    qdrant_client.client.query_batch_points.side_effect = Exception("Failed")
+
+    with pytest.raises(VectorSearchError):
+        qdrant_client.search_vectors_batch("test_collection", [[0.1, 0.2]])
+
+    qdrant_client.logger.error.assert_called_once()
+    qdrant_client.client.query_batch_points.side_effect = None
+
+
+def test_dbclient_backend_error():
+    """
+    Test unsupported backend initialization in DBClient.
+    """
+    with pytest.raises(Exception):
+        DBClient(backend="invalid_backend")
+
+
+def test_create_collection_invalid_distance_metric(qdrant_client):
+    """
+    Test collection creation failure due to invalid distance metric.
+    The ValueError is raised before any request is sent.
+    """
+    qdrant_client.client.create_collection.reset_mock()
+
+    with pytest.raises(
+        ValueError, match="Unsupported distance metric: INVALID_METRIC"
+    ):
+        qdrant_client.create_collection(
+            "test_collection", 128, "INVALID_METRIC"
+        )
+
+    qdrant_client.client.create_collection.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "metric, expected",
+    [
+        ("cosine", Distance.COSINE),
+        ("euclidean", Distance.EUCLID),
+        ("Dot", Distance.DOT),
+        ("MANHATTAN", Distance.MANHATTAN),
+    ],
+)
+def test_create_collection_distance_metrics(qdrant_client, metric, expected):
+    """
+    Test that supported distance metric names map to Qdrant distances.
+    """
+    qdrant_client.client.create_collection.side_effect = None
+
+    qdrant_client.create_collection("test_collection", 128, metric)
+
+    params = qdrant_client.client.create_collection.call_args.args[1]
+    assert params.distance == expected
+
+
+def test_create_collection_unexpected_response(qdrant_client):
+    """
+    Test collection creation failure due to an UnexpectedResponse exception.
+    This will cover lines 145 and 146 where logger.error is called
+    and CollectionCreationError is raised.
+    """
+    qdrant_client.logger.error.reset_mock()  # Ensure isolation between tests
+
+    # Mock the client to raise an UnexpectedResponse with required arguments
+    qdrant_client.client.create_collection.side_effect = UnexpectedResponse(
+        reason_phrase="Bad Request",
+        content="Error occurred while creating collection",
+        headers={"Content-Type": "application/json"},
+        status_code=400,
+    )
+
+    with pytest.raises(
+        CollectionCreationError, match="Failed to create collection"
+    ):
+        qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    # Ensure the logger.error call is made
+    qdrant_client.logger.error.assert_called_once_with(
+        "Failed to create collection", exc_info=True
+    )
+
+
+def test_create_collection_other_failure(qdrant_client):
+    """
+    Test that any non-transient failure raises CollectionCreationError.
+    """
+    qdrant_client.client.create_collection.side_effect = RuntimeError("boom")
+
+    with pytest.raises(CollectionCreationError):
+        qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    qdrant_client.client.create_collection.side_effect = None
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (httpx.ConnectError("connection refused"), True),
+        (FakeRpcError(grpc.StatusCode.UNAVAILABLE), True),
+        (FakeRpcError(grpc.StatusCode.DEADLINE_EXCEEDED), True),
+        (FakeRpcError(grpc.StatusCode.INVALID_ARGUMENT), False),
+        (unexpected_response(503), True),
+        (unexpected_response(409), False),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_is_transient(exc, expected):
+    """
+    Test which errors are treated as transient and retried.
+    """
+    assert _is_transient(exc) is expected
+
+
+def test_create_collection_retries_transient_error(qdrant_client):
+    """
+    Test that a transient error is retried with backoff.
+    """
+    qdrant_client.logger.warning.reset_mock()  # Ensure isolation
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = [
+        httpx.ConnectError("connection reset"),
+        None,
+    ]
+
+    with patch("darca_vector_db.db_client.time.sleep") as mock_sleep:
+        qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    assert qdrant_client.client.create_collection.call_count == 2
+    mock_sleep.assert_called_once_with(0.1)
+    qdrant_client.logger.warning.assert_called_once_with(
+        "Transient error from Qdrant, retrying in %.2fs (%d/%d).",
+        0.1,
+        1,
+        3,
+        exc_info=True,
+    )
+    qdrant_client.client.create_collection.side_effect = None
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (unexpected_response(409), True),
+        (unexpected_response(503), False),
+        (FakeRpcError(grpc.StatusCode.ALREADY_EXISTS), True),
+        (FakeRpcError(grpc.StatusCode.UNAVAILABLE), False),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_is_conflict(exc, expected):
+    """
+    Test which errors report an already existing resource.
+    """
+    assert _is_conflict(exc) is expected
+
+
+def test_create_collection_conflict_after_timeout(qdrant_client):
+    """
+    Test that a conflict on a retry after a timeout counts as success
+    once the collection is confirmed to exist.
+    """
+    qdrant_client.client.create_collection.reset_mock()
+    qdrant_client.client.create_collection.side_effect = [
+        httpx.ReadTimeout("timed out"),
+        unexpected_response(409),
+    ]
+    qdrant_client.client.collection_exists.reset_mock()
+    qdrant_client.client.collection_exists.return_value = True
+
+    with patch("darca_vector_db.db_client.time.sleep"):
+        qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    assert qdrant_client.client.create_collection.call_count == 2
+    qdrant_client.client.collection_exists.assert_called_once_with(
+        "test_collection"
+    )
+    assert qdrant_client._dim_cache["test_collection"] == 128
+    qdrant_client.client.create_collection.side_effect = None
+
+
+def test_create_collection_conflict_not_confirmed(qdrant_client):
+    """
+    Test that a conflict after a timeout fails if the collection is missing.
+    """
+    qdrant_client.client.create_collection.side_effect = [
+        httpx.ReadTimeout("timed out"),
+        unexpected_response(409),
+    ]
+    qdrant_client.client.collection_exists.return_value = False
+
+    with patch("darca_vector_db.db_client.time.sleep"):
+        with pytest.raises(CollectionCreationError):
+            qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    qdrant_client.client.create_collection.side_effect = None
+
+
+def test_create_collection_conflict_on_first_attempt(qdrant_client):
+    """
+    Test that a conflict without an earlier failure is an error.
+    """
+    qdrant_client.client.create_collection.side_effect = unexpected_response(
+        409
+    )
+    qdrant_client.client.collection_exists.reset_mock()
+
+    with pytest.raises(CollectionCreationError):
+        qdrant_client.create_collection("test_collection", 128, "cosine")
+
+    qdrant_client.client.collection_exists.assert_not_called()
+    qdrant_client.client.create_collection.side_effect = None
+
+
+def test_search_vectors_retries_exhausted(qdrant_client):
+    """
+    Test that a persistent transient error fails after all retries.
+    """
+    qdrant_client.clear_search_cache()  # Ensure isolation between tests
+    qdrant_client.client.query_points.reset_mock()
+    qdrant_client.client.query_points.side_effect = unexpected_response(503)
+
+    with patch("darca_vector_db.db_client.time.sleep") as mock_sleep:
+        with pytest.raises(VectorSearchError):
+            qdrant_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    assert qdrant_client.client.query_points.call_count == 4
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2, 0.4]
+    qdrant_client.client.query_points.side_effect = None
+
+
+def test_insert_vector_not_retried_on_client_error(qdrant_client):
+    """
+    Test that non-transient errors are raised without retrying.
+    """
+    qdrant_client.client.upsert.reset_mock()
+    qdrant_client.client.upsert.side_effect = unexpected_response(400)
+
+    with patch("darca_vector_db.db_client.time.sleep") as mock_sleep:
+        with pytest.raises(VectorInsertionError):
+            qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2])
+
+    qdrant_client.client.upsert.assert_called_once()
+    mock_sleep.assert_not_called()
+    qdrant_client.client.upsert.side_effect = None
+
+
+def test_clients_have_no_instance_dict(mock_logger, db_client):
+    """
+    Test that the clients store their attributes in __slots__.
+    """
+    assert not hasattr(QdrantDBClient(), "__dict__")
+    assert not hasattr(AsyncQdrantDBClient(), "__dict__")
+    with pytest.raises(AttributeError):
+        db_client.logger = MagicMock()
+
+
+def test_dbclient_connect(db_client):
+    """
+    Test the connect() method of DBClient.
+    Ensures that the connection is made and the logger.info() is called.
+    """
+    db_client._client.connect = MagicMock()
+
+    db_client.connect()
+
+    db_client._client.connect.assert_called_once()
+    db_client._client.logger.info.assert_called_once_with(
+        "Connected to the vector database."
+    )
+
+
+def test_dbclient_create_collection(db_client):
+    """
+    Test the create_collection() method of DBClient.
+    Ensures that the collection creation is made and the logger.info()
+    is called.
+    """
+    db_client._client.logger.info.reset_mock()  # Ensure isolation
+
+    db_client._client.create_collection = MagicMock()
+
+    db_client.create_collection("test_collection", 128, "cosine")
+
+    db_client._client.create_collection.assert_called_once_with(
+        "test_collection", 128, "cosine"
+    )
+    db_client._client.logger.info.assert_called_once_with(
+        "Collection '%s' created.", "test_collection"
+    )
+
+
+def test_dbclient_insert_vector(db_client):
+    """
+    Test the insert_vector() method of DBClient.
+    Ensures that the call goes straight to the backend method.
+    """
+    assert db_client.insert_vector is db_client._client.insert_vector
+
+    db_client.insert_vector("test_collection", "vec1", [0.1, 0.2, 0.3])
+
+    db_client._client.insert_vector.assert_called_once_with(
+        "test_collection", "vec1", [0.1, 0.2, 0.3]
+    )
+
+
+def test_dbclient_insert_vectors(db_client):
+    """
+    Test the insert_vectors() method of DBClient.
+    Ensures that the call goes straight to the backend method.
+    """
+    assert db_client.insert_vectors is db_client._client.insert_vectors
+
+    db_client.insert_vectors("test_collection", [1, 2], [[0.1], [0.2]])
+
+    db_client._client.insert_vectors.assert_called_once_with(
+        "test_collection", [1, 2], [[0.1], [0.2]]
+    )
+
+
+def test_dbclient_search_vectors(db_client):
+    """
+    Test the search_vectors() method of DBClient.
+    Ensures that the call goes straight to the backend method.
+    """
+    assert db_client.search_vectors is db_client._client.search_vectors
+    db_client._client.search_vectors.return_value = ["result1", "result2"]
+
+    results = db_client.search_vectors("test_collection", [0.1, 0.2, 0.3])
+
+    db_client._client.search_vectors.assert_called_once_with(
+        "test_collection", [0.1, 0.2, 0.3]
+    )
+    assert results == ["result1", "result2"]
+
+
+def test_dbclient_search_vectors_batch(db_client):
+    """
+    Test the search_vectors_batch() method of DBClient.
+    Ensures that the call goes straight to the backend method.
+    """
+    backend = db_client._client
+    assert db_client.search_vectors_batch is backend.search_vectors_batch
+    backend.search_vectors_batch.return_value = [["a"], ["b"]]
+
+    results = db_client.search_vectors_batch("test_collection", [[0.1], [0.2]])
+
+    backend.search_vectors_batch.assert_called_once_with(
+        "test_collection", [[0.1], [0.2]]
+    )
+    assert results == [["a"], ["b"]]
+
+
+def test_dbclient_getattr(db_client):
+    """
+    Test the __getattr__() method of DBClient.
+    Ensures that method calls are delegated to the backend client.
+    """
+    db_client._client.some_method = MagicMock(return_value="delegated")
+
+    result = db_client.some_method()
+
+    assert result == "delegated"
+    db_client._client.some_method.assert_called_once()
+
+
+def test_async_qdrant_connect(async_qdrant_client):
+    """
+    Test that the asynchronous client connects through AsyncQdrantClient.
+    """
+    async_qdrant_client.client = None
+
+    with patch("darca_vector_db.db_client.AsyncQdrantClient") as mock_cls:
+        asyncio.run(async_qdrant_client.connect())
+
+    mock_cls.assert_called_once_with(
+        host="localhost",
+        port=6333,
+        grpc_port=6334,
+        prefer_grpc=True,
+        api_key=None,
+    )
+    assert async_qdrant_client.client is mock_cls.return_value
+
+
+def test_async_qdrant_connect_is_idempotent(async_qdrant_client):
+    """
+    Test that connecting a connected asynchronous client does nothing.
+    """
+    previous = async_qdrant_client.client
+
+    with patch("darca_vector_db.db_client.AsyncQdrantClient") as mock_cls:
+        asyncio.run(async_qdrant_client.connect())
+
+    mock_cls.assert_not_called()
+    assert async_qdrant_client.client is previous
+
+
+def test_async_qdrant_connects_lazily(async_qdrant_client):
+    """
+    Test that the first asynchronous operation connects the client.
+    """
+    async_qdrant_client.client = None
+
+    with patch("darca_vector_db.db_client.AsyncQdrantClient") as mock_cls:
+        mock_cls.return_value = AsyncMock()
+        asyncio.run(
+            async_qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2])
+        )
+
+    assert async_qdrant_client.client is mock_cls.return_value
+    mock_cls.return_value.upsert.assert_awaited_once()
+
+
+def test_async_qdrant_connect_failure(async_qdrant_client):
+    """
+    Test connection failure handling in AsyncQdrantDBClient.
+    """
+    async_qdrant_client.client = None
+
+    with patch(
+        "darca_vector_db.db_client.AsyncQdrantClient",
+        side_effect=Exception("Connection Failed"),
+    ):
+        with pytest.raises(DBConnectionError):
+            asyncio.run(async_qdrant_client.connect())
+
+    async_qdrant_client.logger.error.assert_called_once_with(
+        "Connection to Qdrant failed", exc_info=True
+    )
+
+
+def test_async_qdrant_close(async_qdrant_client):
+    """
+    Test that close() closes the underlying client once.
+    """
+    client = async_qdrant_client.client
+
+    asyncio.run(async_qdrant_client.close())
+    asyncio.run(async_qdrant_client.close())
+
+    client.close.assert_awaited_once()
+    assert async_qdrant_client.client is None
+
+
+def test_async_create_collection(async_qdrant_client):
+    """
+    Test asynchronous collection creation with bulk loading.
+    """
+    asyncio.run(
+        async_qdrant_client.create_collection(
+            "test_collection",
+            3,
+            "euclidean",
+            bulk_load=True,
+            quantization="int8",
+        )
+    )
+
+    args = async_qdrant_client.client.create_collection.call_args
+    assert args.args[1].distance == Distance.EUCLID
+    assert args.kwargs["hnsw_config"].m == 0
+    assert isinstance(args.kwargs["quantization_config"], ScalarQuantization)
+    assert async_qdrant_client._dim_cache == {"test_collection": 3}
+
+
+def test_async_create_collection_failure(async_qdrant_client):
+    """
+    Test asynchronous collection creation failure handling.
+    """
+    async_qdrant_client.client.create_collection.side_effect = (
+        UnexpectedResponse(
+            reason_phrase="Bad Request",
+            content="Error occurred while creating collection",
+            headers={"Content-Type": "application/json"},
+            status_code=400,
+        )
+    )
+
+    with pytest.raises(CollectionCreationError):
+        asyncio.run(
+            async_qdrant_client.create_collection("test_collection", 3)
+        )
+    with pytest.raises(ValueError):
+        asyncio.run(
+            async_qdrant_client.create_collection(
+                "test_collection", 3, "INVALID_METRIC"
+            )
+        )
+
+
+def test_async_vector_size_caches_definite_answers(async_qdrant_client):
+    """
+    Test that asynchronous size lookups cache a missing collection but
+    not a transient failure.
+    """
+    async_qdrant_client.client.get_collection.side_effect = [
+        FakeRpcError(grpc.StatusCode.UNAVAILABLE),
+        FakeRpcError(grpc.StatusCode.NOT_FOUND),
+    ]
+
+    for _ in range(3):
+        asyncio.run(
+            async_qdrant_client.insert_vector("test_collection", 1, [0.1])
+        )
+
+    assert async_qdrant_client.client.get_collection.await_count == 2
+    assert async_qdrant_client._dim_cache == {"test_collection": None}
+
+
+def test_async_insert_vectors_bounded_concurrency(async_qdrant_client):
+    """
+    Test that at most max_concurrency upserts are in flight at once.
+    """
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+    in_flight = 0
+    peak = 0
+
+    async def upsert(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    async_qdrant_client.client.upsert.side_effect = upsert
+
+    asyncio.run(
+        async_qdrant_client.insert_vectors(
+            "test_collection",
+            list(range(20)),
+            np.zeros((20, 2), dtype=np.float32),
+            batch_size=2,
+            max_concurrency=3,
+        )
+    )
+
+    assert async_qdrant_client.client.upsert.await_count == 10
+    assert peak == 3
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(
+            async_qdrant_client.insert_vectors(
+                "test_collection", [1], [[0.1, 0.2]], max_concurrency=0
+            )
+        )
+
+
+def test_async_insert_vectors_stops_after_failure(async_qdrant_client):
+    """
+    Test that no further chunks are sent once an upsert has failed.
+    """
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+    async_qdrant_client.client.upsert.side_effect = Exception("Failed")
+
+    with pytest.raises(VectorInsertionError):
+        asyncio.run(
+            async_qdrant_client.insert_vectors(
+                "test_collection",
+                list(range(20)),
+                np.zeros((20, 2), dtype=np.float32),
+                batch_size=2,
+                max_concurrency=2,
+            )
+        )
+
+    assert async_qdrant_client.client.upsert.await_count == 2
+
+
+def test_async_insert_vectors_invalid_points(async_qdrant_client):
+    """
+    Test that invalid points raise VectorInsertionError asynchronously.
+    """
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+
+    with pytest.raises(VectorInsertionError):
+        asyncio.run(
+            async_qdrant_client.insert_vectors(
+                "test_collection", [1.5], [[0.1, 0.2]]
+            )
+        )
+
+    async_qdrant_client.client.upsert.assert_not_awaited()
+
+
+def test_async_insert_vector_retries_transient_error(async_qdrant_client):
+    """
+    Test that asynchronous requests retry transient gRPC errors.
+    """
+    async_qdrant_client.client.upsert.side_effect = [
+        FakeRpcError(grpc.StatusCode.UNAVAILABLE),
+        None,
+    ]
+
+    with patch(
+        "darca_vector_db.db_client.asyncio.sleep", AsyncMock()
+    ) as mock_sleep:
+        asyncio.run(
+            async_qdrant_client.insert_vector("test_collection", 1, [0.1, 0.2])
+        )
+
+    assert async_qdrant_client.client.upsert.await_count == 2
+    mock_sleep.assert_awaited_once_with(0.1)
+
+
+def test_async_create_collection_conflict_after_timeout(async_qdrant_client):
+    """
+    Test that asynchronous creation accepts a conflict after a timeout
+    once the collection is confirmed to exist.
+    """
+    async_qdrant_client.client.create_collection.side_effect = [
+        FakeRpcError(grpc.StatusCode.DEADLINE_EXCEEDED),
+        FakeRpcError(grpc.StatusCode.ALREADY_EXISTS),
+    ]
+    async_qdrant_client.client.collection_exists.return_value = True
+
+    with patch("darca_vector_db.db_client.asyncio.sleep", AsyncMock()):
+        asyncio.run(
+            async_qdrant_client.create_collection(
+                "test_collection", 128, "cosine"
+            )
+        )
+
+    assert async_qdrant_client.client.create_collection.await_count == 2
+    async_qdrant_client.client.collection_exists.assert_awaited_once_with(
+        "test_collection"
+    )
+    assert async_qdrant_client._dim_cache["test_collection"] == 128
+
+
+def test_async_search_vectors_retries_exhausted(async_qdrant_client):
+    """
+    Test that asynchronous searches fail once the retries are used up.
+    """
+    async_qdrant_client.client.query_points.side_effect = httpx.ReadTimeout(
+        "timed out"
+    )
+
+    with patch("darca_vector_db.db_client.asyncio.sleep", AsyncMock()):
+        with pytest.raises(VectorSearchError):
+            asyncio.run(
+                async_qdrant_client.search_vectors(
+                    "test_collection", [0.1, 0.2, 0.3]
+                )
+            )
+
+    assert async_qdrant_client.client.query_points.await_count == 4
+
+
+def test_async_finalize_index(async_qdrant_client):
+    """
+    Test that the asynchronous finalize_index restores indexing.
+    """
+    asyncio.run(async_qdrant_client.finalize_index("test_collection", m=32))
+
+    kwargs = async_qdrant_client.client.update_collection.call_args.kwargs
+    assert kwargs["hnsw_config"].m == 32
+
+    async_qdrant_client.client.update_collection.side_effect = Exception()
+    with pytest.raises(CollectionUpdateError):
+        asyncio.run(async_qdrant_client.finalize_index("test_collection"))
+
+
+def test_async_insert_vector(async_qdrant_client):
+    """
+    Test asynchronous single vector insertion and failure handling.
+    """
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+
+    asyncio.run(
+        async_qdrant_client.insert_vector(
+            "test_collection", 1, np.float32([0.1, 0.2])
+        )
+    )
+
+    kwargs = async_qdrant_client.client.upsert.call_args.kwargs
+    assert kwargs["points"][0].vector == np.float32([0.1, 0.2]).tolist()
+    assert kwargs["wait"] is False
+
+    async_qdrant_client.client.upsert.side_effect = Exception()
+    with pytest.raises(VectorInsertionError):
+        asyncio.run(
+            async_qdrant_client.insert_vector("test_collection", 1, [0.1])
+        )
+
+
+def test_async_insert_vectors(async_qdrant_client):
+    """
+    Test that asynchronous bulk insertion upserts every chunk.
+    """
+    async_qdrant_client.client.get_collection.return_value = MagicMock()
+    info = async_qdrant_client.client.get_collection.return_value
+    info.config.params.vectors.size = 2
+
+    asyncio.run(
+        async_qdrant_client.insert_vectors(
+            "test_collection",
+            list(range(5)),
+            np.zeros((5, 2), dtype=np.float32),
+            batch_size=2,
+        )
+    )
+
+    calls = async_qdrant_client.client.upsert.await_args_list
+    assert sorted(len(c.kwargs["points"].ids) for c in calls) == [1, 2, 2]
+    with pytest.raises(ValueError, match="Vector dimension 3"):
+        asyncio.run(
+            async_qdrant_client.insert_vectors(
+                "test_collection", [1], [[0.1, 0.2, 0.3]]
+            )
+        )
+
+    async_qdrant_client.client.upsert.side_effect = Exception()
+    with pytest.raises(VectorInsertionError):
+        asyncio.run(
+            async_qdrant_client.insert_vectors(
+                "test_collection", [1], [[0.1, 0.2]]
+            )
+        )
+
+
+def test_async_search_vectors(async_qdrant_client):
+    """
+    Test asynchronous search, including cache hits and failures.
+    """
+    async_qdrant_client.search_cache_size = 8
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+    response = MagicMock(points=["result"])
+    async_qdrant_client.client.query_points.return_value = response
+
+    first = asyncio.run(
+        async_qdrant_client.search_vectors(
+            "test_collection", np.float64([0.1, 0.2])
+        )
+    )
+    second = asyncio.run(
+        async_qdrant_client.search_vectors(
+            "test_collection", np.float32([0.1, 0.2])
+        )
+    )
+
+    assert first == second == ["result"]
+    async_qdrant_client.client.query_points.assert_awaited_once()
+
+    async_qdrant_client.clear_search_cache()
+    async_qdrant_client.client.query_points.side_effect = Exception()
+    with pytest.raises(VectorSearchError):
+        asyncio.run(
+            async_qdrant_client.search_vectors("test_collection", [0.1, 0.2])
+        )
+
+
+def test_async_search_vectors_batch(async_qdrant_client):
+    """
+    Test asynchronous batch search and failure handling.
+    """
+    async_qdrant_client.client.get_collection.side_effect = Exception()
+    async_qdrant_client.client.query_batch_points.return_value = [
+        MagicMock(points=["a"]),
+        MagicMock(points=["b"]),
+    ]
+
+    results = asyncio.run(
+        async_qdrant_client.search_vectors_batch(
+            "test_collection", [[0.1, 0.2], [0.3, 0.4]], top_k=3
+        )
+    )
+
+    assert results == [["a"], ["b"]]
+    kwargs = async_qdrant_client.client.query_batch_points.call_args.kwargs
+    assert [r.limit for r in kwargs["requests"]] == [3, 3]
+
+    async_qdrant_client.client.query_batch_points.side_effect = Exception()
+    with pytest.raises(VectorSearchError):
+        asyncio.run(
+            async_qdrant_client.search_vectors_batch(
+                "test_collection", [[0.1, 0.2]]
+            )
+        )
+
+
+def test_async_dbclient(async_db_client):
+    """
+    Test the AsyncDBClient facade delegates to the asynchronous backend.
+    """
+    backend = async_db_client._client
+    assert async_db_client.insert_vector is backend.insert_vector
+    assert async_db_client.insert_vectors is backend.insert_vectors
+    assert async_db_client.search_vectors is backend.search_vectors
+    assert async_db_client.search_vectors_batch is backend.search_vectors_batch
+    assert async_db_client.finalize_index is backend.finalize_index
+
+    asyncio.run(async_db_client.connect())
+    asyncio.run(
+        async_db_client.create_collection(
+            "test_collection", 128, bulk_load=True
+        )
+    )
+
+    backend.connect.assert_awaited_once()
+    backend.create_collection.assert_awaited_once_with(
+        "test_collection", 128, "cosine", bulk_load=True
+    )
+    async_db_client._client.logger.info.assert_any_call(
+        "Connected to the vector database."
+    )
+    async_db_client._client.logger.info.assert_any_call(
+        "Collection '%s' created.", "test_collection"
+    )
+
+
+def test_async_dbclient_backend_error(mock_logger):
+    """
+    Test unsupported backend initialization in AsyncDBClient.
+    """
+    with pytest.raises(DBClientException):
+        AsyncDBClient(backend="invalid_backend")